@@ -9,12 +9,75 @@ Based on genericVDC.proto specification.
 from __future__ import annotations
 
 import logging
+from functools import cached_property
 from typing import Any, Callable, Optional
 
 from . import genericVDC_pb2 as pb
+from .message_builder import MessageBuilder
 
 _LOGGER = logging.getLogger(__name__)
 
+# Builder for generic error responses (vDC dSUID is not needed for these)
+_ERROR_BUILDER = MessageBuilder("")
+
+# Tag byte of Message.type: field number 1, wire type 0 (varint)
+_TYPE_FIELD_TAG = 0x08
+
+
+def peek_message_type(data: bytes) -> Optional[int]:
+    """Read the message type from raw bytes without decoding the message.
+    
+    Message.type is field 1 and is serialized first, so the type can be read
+    from the leading varint. This allows dropping messages nobody handles
+    before paying for a full protobuf parse.
+    
+    Args:
+        data: Raw protobuf message bytes
+        
+    Returns:
+        Type enum value, or None if the bytes do not start with the type field
+    """
+    if not data or data[0] != _TYPE_FIELD_TAG:
+        return None
+    
+    result = 0
+    shift = 0
+    # A varint is at most 10 bytes long
+    for byte in data[1:11]:
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result
+        shift += 7
+    return None
+
+
+# Message type -> name, built once instead of walking the enum descriptor
+_TYPE_NAMES: dict[int, str] = {value.number: value.name for value in pb.Type.DESCRIPTOR.values}
+
+# Message type -> (payload field name, whether dSUID is a repeated field)
+_PAYLOAD_FIELDS: dict[int, tuple[str, bool]] = {
+    # Requests
+    pb.VDSM_REQUEST_HELLO: ("vdsm_request_hello", False),
+    pb.VDSM_REQUEST_GET_PROPERTY: ("vdsm_request_get_property", False),
+    pb.VDSM_REQUEST_SET_PROPERTY: ("vdsm_request_set_property", False),
+    pb.VDSM_REQUEST_GENERIC_REQUEST: ("vdsm_request_generic_request", False),
+    # Pings and control messages
+    pb.VDSM_SEND_PING: ("vdsm_send_ping", False),
+    pb.VDSM_SEND_REMOVE: ("vdsm_send_remove", False),
+    pb.VDSM_SEND_BYE: ("vdsm_send_bye", False),
+    # Scene notifications
+    pb.VDSM_NOTIFICATION_CALL_SCENE: ("vdsm_send_call_scene", True),
+    pb.VDSM_NOTIFICATION_SAVE_SCENE: ("vdsm_send_save_scene", True),
+    pb.VDSM_NOTIFICATION_UNDO_SCENE: ("vdsm_send_undo_scene", True),
+    pb.VDSM_NOTIFICATION_SET_LOCAL_PRIO: ("vdsm_send_set_local_prio", True),
+    pb.VDSM_NOTIFICATION_CALL_MIN_SCENE: ("vdsm_send_call_min_scene", True),
+    # Device notifications
+    pb.VDSM_NOTIFICATION_IDENTIFY: ("vdsm_send_identify", True),
+    pb.VDSM_NOTIFICATION_SET_CONTROL_VALUE: ("vdsm_send_set_control_value", True),
+    pb.VDSM_NOTIFICATION_DIM_CHANNEL: ("vdsm_send_dim_channel", True),
+    pb.VDSM_NOTIFICATION_SET_OUTPUT_CHANNEL_VALUE: ("vdsm_send_output_channel_value", True),
+}
+
 
 class ParsedMessage:
     """Represents a parsed protobuf message with metadata."""
@@ -39,10 +102,10 @@ class ParsedMessage:
         self.dsuid = dsuid
         self.payload = payload
     
-    @property
+    @cached_property
     def type_name(self) -> str:
         """Get human-readable message type name."""
-        return pb.Type.Name(self.message_type)
+        return _TYPE_NAMES.get(self.message_type, str(self.message_type))
     
     def __repr__(self) -> str:
         """String representation of parsed message."""
@@ -69,8 +132,7 @@ class MessageHandler:
             ParsedMessage object or None if parsing fails
         """
         try:
-            msg = pb.Message()
-            msg.ParseFromString(data)
+            msg = pb.Message.FromString(data)
             
             message_type = msg.type
             message_id = msg.message_id if msg.HasField("message_id") else 0
@@ -85,11 +147,12 @@ class MessageHandler:
                 payload=payload,
             )
             
-            _LOGGER.debug(f"Parsed message: {parsed}")
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Parsed message: %s", parsed)
             return parsed
             
         except Exception as e:
-            _LOGGER.error(f"Failed to parse message: {e}", exc_info=True)
+            _LOGGER.error("Failed to parse message: %s", e, exc_info=True)
             return None
     
     def register_handler(
@@ -104,7 +167,18 @@ class MessageHandler:
             handler: Callable that takes a ParsedMessage and returns a response
         """
         self._handlers[message_type] = handler
-        _LOGGER.debug(f"Registered handler for {pb.Type.Name(message_type)}")
+        _LOGGER.debug("Registered handler for %s", _TYPE_NAMES.get(message_type, message_type))
+    
+    def has_handler(self, message_type: int) -> bool:
+        """Check whether a handler is registered for a message type.
+        
+        Args:
+            message_type: Type enum value (from pb.Type)
+            
+        Returns:
+            True if a handler is registered, False otherwise
+        """
+        return message_type in self._handlers
     
     async def handle_message(
         self,
@@ -121,24 +195,23 @@ class MessageHandler:
         handler = self._handlers.get(parsed_msg.message_type)
         
         if not handler:
-            _LOGGER.warning(f"No handler registered for {parsed_msg.type_name}")
+            _LOGGER.warning("No handler registered for %s", parsed_msg.type_name)
             return None
         
         try:
-            _LOGGER.debug(f"Dispatching {parsed_msg.type_name} to handler")
+            _LOGGER.debug("Dispatching %s to handler", parsed_msg.type_name)
             response = await handler(parsed_msg)
             return response
             
         except Exception as e:
             _LOGGER.error(
-                f"Error handling {parsed_msg.type_name}: {e}",
+                "Error handling %s: %s",
+                parsed_msg.type_name,
+                e,
                 exc_info=True,
             )
             # Return error response
-            # Note: vDC dSUID is not needed for generic error responses
-            from .message_builder import MessageBuilder
-            builder = MessageBuilder("")
-            return builder.create_generic_response(
+            return _ERROR_BUILDER.create_generic_response(
                 code=pb.ERR_MESSAGE_UNKNOWN,
                 description=f"Handler error: {str(e)}",
                 message_id=parsed_msg.message_id,
@@ -158,102 +231,20 @@ class MessageHandler:
         Returns:
             Tuple of (dsuid, payload) where payload is the specific message object
         """
-        dsuid = None
-        payload = None
+        entry = _PAYLOAD_FIELDS.get(message_type)
+        if entry is None:
+            return None, None
         
-        # Requests
-        if message_type == pb.VDSM_REQUEST_HELLO:
-            if msg.HasField("vdsm_request_hello"):
-                payload = msg.vdsm_request_hello
-                dsuid = payload.dSUID if payload.HasField("dSUID") else None
+        field_name, repeated_dsuid = entry
+        if not msg.HasField(field_name):
+            return None, None
         
-        elif message_type == pb.VDSM_REQUEST_GET_PROPERTY:
-            if msg.HasField("vdsm_request_get_property"):
-                payload = msg.vdsm_request_get_property
-                dsuid = payload.dSUID if payload.HasField("dSUID") else None
-        
-        elif message_type == pb.VDSM_REQUEST_SET_PROPERTY:
-            if msg.HasField("vdsm_request_set_property"):
-                payload = msg.vdsm_request_set_property
-                dsuid = payload.dSUID if payload.HasField("dSUID") else None
-        
-        elif message_type == pb.VDSM_REQUEST_GENERIC_REQUEST:
-            if msg.HasField("vdsm_request_generic_request"):
-                payload = msg.vdsm_request_generic_request
-                dsuid = payload.dSUID if payload.HasField("dSUID") else None
-        
-        # Pings and control messages
-        elif message_type == pb.VDSM_SEND_PING:
-            if msg.HasField("vdsm_send_ping"):
-                payload = msg.vdsm_send_ping
-                dsuid = payload.dSUID if payload.HasField("dSUID") else None
-        
-        elif message_type == pb.VDSM_SEND_REMOVE:
-            if msg.HasField("vdsm_send_remove"):
-                payload = msg.vdsm_send_remove
-                dsuid = payload.dSUID if payload.HasField("dSUID") else None
-        
-        elif message_type == pb.VDSM_SEND_BYE:
-            if msg.HasField("vdsm_send_bye"):
-                payload = msg.vdsm_send_bye
-                dsuid = payload.dSUID if payload.HasField("dSUID") else None
-        
-        # Scene notifications
-        elif message_type == pb.VDSM_NOTIFICATION_CALL_SCENE:
-            if msg.HasField("vdsm_send_call_scene"):
-                payload = msg.vdsm_send_call_scene
-                # Note: CallScene has repeated dSUID field
-                if len(payload.dSUID) > 0:
-                    dsuid = payload.dSUID[0]  # Take first device
-        
-        elif message_type == pb.VDSM_NOTIFICATION_SAVE_SCENE:
-            if msg.HasField("vdsm_send_save_scene"):
-                payload = msg.vdsm_send_save_scene
-                if len(payload.dSUID) > 0:
-                    dsuid = payload.dSUID[0]
-        
-        elif message_type == pb.VDSM_NOTIFICATION_UNDO_SCENE:
-            if msg.HasField("vdsm_send_undo_scene"):
-                payload = msg.vdsm_send_undo_scene
-                if len(payload.dSUID) > 0:
-                    dsuid = payload.dSUID[0]
-        
-        elif message_type == pb.VDSM_NOTIFICATION_SET_LOCAL_PRIO:
-            if msg.HasField("vdsm_send_set_local_prio"):
-                payload = msg.vdsm_send_set_local_prio
-                if len(payload.dSUID) > 0:
-                    dsuid = payload.dSUID[0]
-        
-        elif message_type == pb.VDSM_NOTIFICATION_CALL_MIN_SCENE:
-            if msg.HasField("vdsm_send_call_min_scene"):
-                payload = msg.vdsm_send_call_min_scene
-                if len(payload.dSUID) > 0:
-                    dsuid = payload.dSUID[0]
-        
-        # Device notifications
-        elif message_type == pb.VDSM_NOTIFICATION_IDENTIFY:
-            if msg.HasField("vdsm_send_identify"):
-                payload = msg.vdsm_send_identify
-                if len(payload.dSUID) > 0:
-                    dsuid = payload.dSUID[0]
-        
-        elif message_type == pb.VDSM_NOTIFICATION_SET_CONTROL_VALUE:
-            if msg.HasField("vdsm_send_set_control_value"):
-                payload = msg.vdsm_send_set_control_value
-                if len(payload.dSUID) > 0:
-                    dsuid = payload.dSUID[0]
-        
-        elif message_type == pb.VDSM_NOTIFICATION_DIM_CHANNEL:
-            if msg.HasField("vdsm_send_dim_channel"):
-                payload = msg.vdsm_send_dim_channel
-                if len(payload.dSUID) > 0:
-                    dsuid = payload.dSUID[0]
-        
-        elif message_type == pb.VDSM_NOTIFICATION_SET_OUTPUT_CHANNEL_VALUE:
-            if msg.HasField("vdsm_send_output_channel_value"):
-                payload = msg.vdsm_send_output_channel_value
-                if len(payload.dSUID) > 0:
-                    dsuid = payload.dSUID[0]
+        payload = getattr(msg, field_name)
+        if repeated_dsuid:
+            # Notifications address several devices; take the first one
+            dsuid = payload.dSUID[0] if len(payload.dSUID) > 0 else None
+        else:
+            dsuid = payload.dSUID if payload.HasField("dSUID") else None
         
         return dsuid, payload
 
@@ -267,20 +258,11 @@ def extract_property_value(prop_value: pb.PropertyValue) -> Any:
     Returns:
         Python value (bool, int, float, str, or bytes)
     """
-    if prop_value.HasField("v_bool"):
-        return prop_value.v_bool
-    elif prop_value.HasField("v_uint64"):
-        return prop_value.v_uint64
-    elif prop_value.HasField("v_int64"):
-        return prop_value.v_int64
-    elif prop_value.HasField("v_double"):
-        return prop_value.v_double
-    elif prop_value.HasField("v_string"):
-        return prop_value.v_string
-    elif prop_value.HasField("v_bytes"):
-        return prop_value.v_bytes
-    else:
-        return None
+    # The v_* fields aren't a oneof, but ListFields() returns the set fields
+    # ordered by field number (v_bool=1 ... v_bytes=6), so the first entry is
+    # the value with the highest precedence, in a single call
+    fields = prop_value.ListFields()
+    return fields[0][1] if fields else None
 
 
 def extract_property_elements(
@@ -294,20 +276,26 @@ def extract_property_elements(
     Returns:
         List of dictionaries with 'name', 'value', and optional 'elements' keys
     """
-    result = []
+    result: list[dict[str, Any]] = []
     
-    for elem in elements:
-        prop_dict = {}
-        
-        if elem.HasField("name"):
-            prop_dict["name"] = elem.name
-        
-        if elem.HasField("value"):
-            prop_dict["value"] = extract_property_value(elem.value)
-        
-        if len(elem.elements) > 0:
-            prop_dict["elements"] = extract_property_elements(elem.elements)
-        
-        result.append(prop_dict)
+    # Walk nested elements with an explicit work list instead of recursion:
+    # each entry is a list of elements and the result list to fill with them
+    pending = [(elements, result)]
+    while pending:
+        current, sink = pending.pop()
+        append = sink.append
+        for elem in current:
+            prop_dict = {"name": elem.name} if elem.HasField("name") else {}
+            
+            if elem.HasField("value"):
+                prop_dict["value"] = extract_property_value(elem.value)
+            
+            sub_elements = elem.elements
+            if sub_elements:
+                children: list[dict[str, Any]] = []
+                prop_dict["elements"] = children
+                pending.append((sub_elements, children))
+            
+            append(prop_dict)
     
     return result
@@ -3,6 +3,7 @@
 from .models.device_classes import (
     ADDITIONAL_COLOR_GROUPS,
     DEVICE_CLASSES,
+    DEVICE_CLASSES_BY_GID,
     DSColor,
     DSGroupID,
     DSPrimaryChannel,
@@ -21,7 +22,7 @@ DEFAULT_VENDOR = "KarlKiel"
 
 # Storage
 STORAGE_FILE = "virtual_digitalstrom_devices.yaml"
-STATE_LISTENER_MAPPINGS_FILE = "virtual_digitalstrom_listener_mappings.yaml"
+STATE_LISTENER_MAPPINGS_FILE = "virtual_digitalstrom_listener_mappings.json"
 VDC_CONFIG_FILE = "virtual_digitalstrom_vdc_config.yaml"
 
 # Configuration keys
@@ -39,6 +40,7 @@ __all__ = [
     "CONF_DSS_PORT",
     "DEFAULT_DSS_PORT",
     "DEVICE_CLASSES",
+    "DEVICE_CLASSES_BY_GID",
     "ADDITIONAL_COLOR_GROUPS",
     "DSColor",
     "DSGroupID",
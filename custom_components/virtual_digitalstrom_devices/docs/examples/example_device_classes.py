@@ -9,16 +9,24 @@ installing the package. In production code, you would import from the installed
 package instead: from custom_components.virtual_digitalstrom_devices import ...
 """
 
+import contextlib
+import io
 import sys
+from collections import Counter
 from pathlib import Path
 
+# Example directory, resolved once
+_HERE = Path(__file__).resolve().parent
+
 # Add the current directory to the path for standalone execution
 # This is only for demonstration purposes; in production, import from the installed package
-sys.path.insert(0, str(Path(__file__).parent))
+if str(_HERE) not in sys.path:
+    sys.path.insert(0, str(_HERE))
 
 from device_classes import (
     ADDITIONAL_COLOR_GROUPS,
     DEVICE_CLASSES,
+    DEVICE_CLASSES_BY_GID,
     DSColor,
     DSGroupID,
     get_all_device_classes,
@@ -48,7 +56,7 @@ def main():
     print(f"Total device classes: {len(all_classes)}")
     print()
     
-    for dc in sorted(all_classes, key=lambda x: x.group_id):
+    for dc in DEVICE_CLASSES_BY_GID:
         channel = dc.primary_channel.value if dc.primary_channel else "None"
         print(f"ID {dc.group_id:2d}: {dc.name:25s} [{dc.color.value:8s}] → {channel}")
     print()
@@ -71,7 +79,8 @@ def main():
     print(f"Found {len(blue_classes)} climate device classes:")
     print()
     
-    for dc in sorted(blue_classes, key=lambda x: x.group_id):
+    # Already sorted by group ID
+    for dc in blue_classes:
         print(f"  {dc.name:25s} (ID: {dc.group_id:2d})")
         print(f"    Applications: {', '.join(dc.applications)}")
         if dc.primary_channel:
@@ -92,13 +101,11 @@ def main():
     
     # Example 5: Color group summary
     print_separator("Example 5: Color Group Summary", "-")
-    color_counts = {}
-    for dc in all_classes:
-        color_counts[dc.color] = color_counts.get(dc.color, 0) + 1
+    color_counts = Counter(dc.color for dc in all_classes)
     
     print(f"Device classes by color:")
     for color in DSColor:
-        count = color_counts.get(color, 0)
+        count = color_counts[color]
         if count > 0:
             print(f"  {color.value:10s}: {count:2d} device class(es)")
     print()
@@ -137,4 +144,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Collect all output and emit it with a single write
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())
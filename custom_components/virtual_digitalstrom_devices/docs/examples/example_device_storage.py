@@ -8,15 +8,21 @@ NOTE: To run this example standalone, execute it from within the integration dir
 cd custom_components/virtual_digitalstrom_devices && python3 example_device_storage.py
 """
 
+import contextlib
+import io
 import sys
 from pathlib import Path
 
+# Example directory and storage file, resolved once
+_HERE = Path(__file__).resolve().parent
+# The .json suffix selects the fast JSON storage format
+_STORAGE_PATH = _HERE / "example_devices.json"
+
 # For standalone execution, add current directory to path
 # This allows direct module imports without loading the package __init__.py
 if __name__ == "__main__":
-    current_dir = Path(__file__).parent
-    if str(current_dir) not in sys.path:
-        sys.path.insert(0, str(current_dir))
+    if str(_HERE) not in sys.path:
+        sys.path.insert(0, str(_HERE))
 
 # Direct module imports for standalone execution
 import virtual_device
@@ -28,8 +34,7 @@ def main():
     """Example usage of device storage."""
     
     # Initialize device storage
-    storage_file = Path("example_devices.yaml")
-    storage = device_storage.DeviceStorage(storage_file)
+    storage = device_storage.DeviceStorage(_STORAGE_PATH)
     
     print("=== Virtual digitalSTROM Device Storage Example ===\n")
     
@@ -66,22 +71,23 @@ def main():
         attributes={"position": 50, "tilt": 45}
     )
     
-    # Add devices to storage
-    storage.add_device(light)
-    storage.add_device(blind)
-    
-    print(f"Added {len(storage.get_all_devices())} devices\n")
-    
-    # List all devices
-    print("All devices:")
-    for device in storage.get_all_devices():
-        print(f"  - {device.name} (Group: {device.group_id}, Entity: {device.ha_entity_id})")
-    
-    print(f"\n✓ Devices saved to {storage_file}")
+    # Add and update devices in one batch - the YAML file is written once
+    with storage.batch():
+        storage.add_device(light)
+        storage.add_device(blind)
+        
+        print(f"Added {len(storage.get_all_devices())} devices\n")
+        
+        # List all devices
+        print("All devices:")
+        for device in storage.get_all_devices():
+            print(f"  - {device.name} (Group: {device.group_id}, Entity: {device.ha_entity_id})")
+        
+        # Update a device
+        print(f"\nUpdating {light.name}...")
+        storage.update_device(light.device_id, name="Main Living Room Light")
     
-    # Update a device
-    print(f"\nUpdating {light.name}...")
-    storage.update_device(light.device_id, name="Main Living Room Light")
+    print(f"\n✓ Devices saved to {_STORAGE_PATH.name}")
     
     # Get devices by group
     print("\nDevices in LIGHTS group:")
@@ -89,8 +95,14 @@ def main():
         print(f"  - {device.name}")
     
     print("\n✓ Example completed successfully!")
-    print(f"\nYou can find the device configuration in: {storage_file.absolute()}")
+    print(f"\nYou can find the device configuration in: {_STORAGE_PATH}")
 
 
 if __name__ == "__main__":
-    main()
+    # Collect all output and emit it with a single write
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())
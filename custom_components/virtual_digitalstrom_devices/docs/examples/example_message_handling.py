@@ -8,12 +8,17 @@ would integrate with Home Assistant's async architecture.
 """
 
 import asyncio
+import contextlib
+import io
 import logging
+import sys
+from collections import OrderedDict
+from operator import itemgetter
 from pathlib import Path
 
 # Import the message handling components
 from message_builder import MessageBuilder, create_property_dict
-from message_handler import MessageHandler
+from message_handler import MessageHandler, peek_message_type
 from vdc_message_dispatcher import VdcMessageDispatcher
 import genericVDC_pb2 as pb
 
@@ -25,6 +30,12 @@ import genericVDC_pb2 as pb
 logging.basicConfig(level=logging.DEBUG)
 _LOGGER = logging.getLogger(__name__)
 
+# Maximum number of serialized push messages kept in the LRU cache
+PUSH_CACHE_SIZE = 1024
+
+# Sort key for (name, value) pairs - orders by property name only
+_BY_NAME = itemgetter(0)
+
 
 class ExampleVdcIntegration:
     """Example vDC integration showing message handling setup."""
@@ -46,6 +57,10 @@ class ExampleVdcIntegration:
         self.message_handler = MessageHandler()
         self.message_builder = MessageBuilder(vdc_dsuid)
         
+        # Serialized PushProperty messages keyed by (device_dsuid, properties)
+        # Sensors frequently re-push unchanged values, so the bytes are reused
+        self._push_cache: OrderedDict[tuple, bytes] = OrderedDict()
+        
         # In real implementation:
         # self.dispatcher = VdcMessageDispatcher(
         #     hass=hass,
@@ -164,6 +179,13 @@ class ExampleVdcIntegration:
         Returns:
             Response bytes to send back, or None if no response
         """
+        # Drop messages without a handler before decoding them
+        # (falls through to a full parse if the type cannot be peeked)
+        message_type = peek_message_type(data)
+        if message_type is not None and not self.message_handler.has_handler(message_type):
+            _LOGGER.debug(f"Ignoring message type {message_type} (no handler registered)")
+            return None
+        
         # Parse the message
         parsed_msg = self.message_handler.parse_message(data)
         
@@ -219,8 +241,52 @@ class ExampleVdcIntegration:
         Returns:
             Serialized push property message bytes
         """
+        key = self._push_cache_key(device_dsuid, properties)
+        if key is not None and key in self._push_cache:
+            self._push_cache.move_to_end(key)
+            return self._push_cache[key]
+        
         msg = self.message_builder.create_push_property(device_dsuid, properties)
-        return msg.SerializeToString()
+        push_bytes = msg.SerializeToString()
+        
+        if key is not None:
+            self._push_cache[key] = push_bytes
+            if len(self._push_cache) > PUSH_CACHE_SIZE:
+                self._push_cache.popitem(last=False)
+        
+        return push_bytes
+    
+    @staticmethod
+    def _push_cache_key(
+        device_dsuid: str,
+        properties: list[dict],
+    ) -> tuple | None:
+        """Build the push cache key, or None if the properties are not cacheable.
+        
+        Properties with nested elements or unhashable values (e.g. lists)
+        are always built from scratch. Each value's type is part of the key:
+        1, True and 1.0 compare (and hash) equal but are encoded as
+        different PropertyValue fields.
+        """
+        if any("elements" in prop for prop in properties):
+            return None
+        
+        try:
+            key = (
+                device_dsuid,
+                tuple(sorted(
+                    (
+                        (prop["name"], type(value), value)
+                        for prop in properties
+                        for value in (prop.get("value"),)
+                    ),
+                    key=_BY_NAME,
+                )),
+            )
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
 
 async def example_usage():
@@ -335,6 +401,34 @@ async def example_usage():
     print("\n=== Example complete ===")
 
 
+def _cli():
+    """Run the example once from the command line.
+    
+    Uses uvloop as the event loop when it is installed. For repeated
+    programmatic runs (e.g. in tests), reuse one loop instead of calling
+    this function each time:
+    
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(example_usage())
+        finally:
+            loop.close()
+    """
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+    
+    # Collect all output and emit it with a single write
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            asyncio.run(example_usage())
+    finally:
+        sys.stdout.write(buffer.getvalue())
+
+
 if __name__ == "__main__":
-    # Run the example
-    asyncio.run(example_usage())
+    _cli()
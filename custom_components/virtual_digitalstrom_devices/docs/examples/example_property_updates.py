@@ -5,8 +5,14 @@ This script shows how to update CONFIG and STATE properties with:
 - STATE updates: 
   - OUTPUT/CONTROL properties: Pushed to mapped HA entities + selective persistence
   - INPUT properties (sensors, binary inputs): Persisted only, NOT pushed to HA (read-only)
+
+Set VDS_EXAMPLES_VERBOSE=1 to print a line for every update step.
 """
 
+import asyncio
+import functools
+import os
+
 from homeassistant.core import HomeAssistant
 
 from .device_storage import DeviceStorage
@@ -14,6 +20,25 @@ from .property_updater import PropertyUpdater
 from .state_listener import StatePropertyType
 from .virtual_device import VirtualDevice
 
+# (property type, index) keys of an RGBW light's channels: brightness, red, green, blue
+_RGBW_KEYS = tuple((StatePropertyType.CHANNEL_VALUE, i) for i in range(4))
+
+# Per-step progress lines are only printed when VDS_EXAMPLES_VERBOSE=1, so
+# looping the examples (smoke tests, timing runs) is not dominated by stdout
+VERBOSE = os.environ.get("VDS_EXAMPLES_VERBOSE") == "1"
+
+
+def _report(message: str) -> None:
+    """Print a progress line if verbose output is enabled."""
+    if VERBOSE:
+        print(message)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_updater(hass: HomeAssistant, storage: DeviceStorage) -> PropertyUpdater:
+    """Return the PropertyUpdater shared by all examples using hass and storage."""
+    return PropertyUpdater(hass, storage)
+
 
 async def example_1_update_config_properties(
     hass: HomeAssistant,
@@ -33,7 +58,7 @@ async def example_1_update_config_properties(
         property_type="name",
         value="Living Room Main Light",
     )
-    print(f"✓ Updated device name")
+    _report(f"✓ Updated device name")
     
     # Update zone assignment
     await updater.update_property(
@@ -41,7 +66,7 @@ async def example_1_update_config_properties(
         property_type="zone_id",
         value=5,
     )
-    print(f"✓ Updated zone_id to zone 5")
+    _report(f"✓ Updated zone_id to zone 5")
     
     # Update model information
     await updater.update_property(
@@ -49,7 +74,7 @@ async def example_1_update_config_properties(
         property_type="model_version",
         value="2.0.0",
     )
-    print(f"✓ Updated model_version to 2.0.0")
+    _report(f"✓ Updated model_version to 2.0.0")
     
     # Update nested attribute
     await updater.config_updater.update_config_property(
@@ -57,7 +82,7 @@ async def example_1_update_config_properties(
         property_path="attributes.num_channels",
         value=4,
     )
-    print(f"✓ Updated num_channels attribute")
+    _report(f"✓ Updated num_channels attribute")
     
     # All changes automatically persisted to YAML
 
@@ -84,7 +109,7 @@ async def example_2_update_state_properties(
         value=75.0,  # 75% brightness
         index=0,  # First channel
     )
-    print(f"✓ Updated channel[0] to 75% (pushed to HA entity)")
+    _report(f"✓ Updated channel[0] to 75% (pushed to HA entity)")
     
     # Update sensor value (READ-ONLY INPUT)
     # Sensor values are INPUT properties (read from HA entities via listeners)
@@ -97,7 +122,7 @@ async def example_2_update_state_properties(
         index=0,
         persist_state=True,  # Force persistence
     )
-    print(f"✓ Updated sensor[0] to 23.5°C (persisted only, NOT pushed - read-only input)")
+    _report(f"✓ Updated sensor[0] to 23.5°C (persisted only, NOT pushed - read-only input)")
     
     # Update button value (transient event, READ-ONLY INPUT)
     # Button clicks are INPUT events (read from HA entities)
@@ -109,7 +134,7 @@ async def example_2_update_state_properties(
         index=0,
         persist_state=False,  # Don't persist transient event
     )
-    print(f"✓ Updated button[0] to pressed (pushed to HA entity, not persisted)")
+    _report(f"✓ Updated button[0] to pressed (pushed to HA entity, not persisted)")
 
 
 async def example_3_critical_control_values(
@@ -133,7 +158,7 @@ async def example_3_critical_control_values(
         value=21.5,  # 21.5°C target
         # persist_state=True is automatic for control values
     )
-    print(f"✓ Updated heating level to 21.5°C (CRITICAL - auto-persisted)")
+    _report(f"✓ Updated heating level to 21.5°C (CRITICAL - auto-persisted)")
     
     # Update cooling level
     await updater.update_property(
@@ -141,7 +166,7 @@ async def example_3_critical_control_values(
         property_type=StatePropertyType.CONTROL_COOLING_LEVEL.value,
         value=24.0,  # 24°C cooling target
     )
-    print(f"✓ Updated cooling level to 24.0°C (CRITICAL - auto-persisted)")
+    _report(f"✓ Updated cooling level to 24.0°C (CRITICAL - auto-persisted)")
     
     # Update ventilation level
     await updater.update_property(
@@ -149,7 +174,7 @@ async def example_3_critical_control_values(
         property_type=StatePropertyType.CONTROL_VENTILATION_LEVEL.value,
         value=50.0,  # 50% fan speed
     )
-    print(f"✓ Updated ventilation level to 50% (CRITICAL - auto-persisted)")
+    _report(f"✓ Updated ventilation level to 50% (CRITICAL - auto-persisted)")
 
 
 async def example_4_batch_updates(
@@ -174,21 +199,16 @@ async def example_4_batch_updates(
         device_id=device_id,
         updates=config_updates,
     )
-    print(f"✓ Updated {len(config_updates)} CONFIG properties in batch")
+    _report(f"✓ Updated {len(config_updates)} CONFIG properties in batch")
     
     # Batch STATE updates
-    state_updates = {
-        (StatePropertyType.CHANNEL_VALUE, 0): 100.0,  # Brightness to 100%
-        (StatePropertyType.CHANNEL_VALUE, 1): 255.0,  # Red to max
-        (StatePropertyType.CHANNEL_VALUE, 2): 0.0,    # Green to 0
-        (StatePropertyType.CHANNEL_VALUE, 3): 0.0,    # Blue to 0
-    }
+    state_updates = dict(zip(_RGBW_KEYS, (100.0, 255.0, 0.0, 0.0)))
     await updater.state_updater.update_multiple_state_properties(
         device_id=device_id,
         updates=state_updates,
         persist=True,
     )
-    print(f"✓ Updated 4 channel values in batch (RGB: red at full brightness)")
+    _report(f"✓ Updated 4 channel values in batch (RGB: red at full brightness)")
 
 
 async def example_5_indexed_config_properties(
@@ -210,7 +230,7 @@ async def example_5_indexed_config_properties(
         value=1,  # Yellow group (lights)
         index=0,
     )
-    print(f"✓ Updated buttonInputSettings[0].group to 1 (lights)")
+    _report(f"✓ Updated buttonInputSettings[0].group to 1 (lights)")
     
     # Update button input setting for button 1
     await updater.config_updater.update_config_property(
@@ -219,7 +239,7 @@ async def example_5_indexed_config_properties(
         value=2,  # Gray group (blinds)
         index=1,
     )
-    print(f"✓ Updated buttonInputSettings[1].group to 2 (blinds)")
+    _report(f"✓ Updated buttonInputSettings[1].group to 2 (blinds)")
     
     # Update sensor input description
     await updater.config_updater.update_config_property(
@@ -228,7 +248,7 @@ async def example_5_indexed_config_properties(
         value="Temperature Sensor",
         index=0,
     )
-    print(f"✓ Updated sensorInputDescriptions[0].name")
+    _report(f"✓ Updated sensorInputDescriptions[0].name")
     
     # Update channel description
     await updater.config_updater.update_config_property(
@@ -237,7 +257,7 @@ async def example_5_indexed_config_properties(
         value="Brightness",
         index=0,
     )
-    print(f"✓ Updated channelDescriptions[0].name")
+    _report(f"✓ Updated channelDescriptions[0].name")
 
 
 async def example_6_multi_instance_state_updates(
@@ -250,40 +270,44 @@ async def example_6_multi_instance_state_updates(
     """
     print("\n=== Example 6: Multi-Instance STATE Updates ===\n")
     
-    # 8-button control panel
-    device_id = "button_panel_8"
-    
-    for i in range(8):
-        await updater.update_property(
-            device_id=device_id,
-            property_type=StatePropertyType.BUTTON_VALUE.value,
-            value=False,  # All buttons released
-            index=i,
-            persist_state=False,  # Don't persist button events
-        )
-    print(f"✓ Updated 8 button values")
-    
-    # Multi-zone climate system (3 zones)
-    for zone_idx in range(3):
-        # Each zone has heating, cooling, and ventilation controls
-        await updater.update_property(
-            device_id=f"climate_zone_{zone_idx}",
-            property_type=StatePropertyType.CONTROL_HEATING_LEVEL.value,
-            value=20.0 + zone_idx,  # Different temp per zone
-            index=0,
-        )
-    print(f"✓ Updated 3 zone heating levels")
-    
-    # RGB+W light (4 channels)
-    rgb_values = [100.0, 255.0, 128.0, 64.0]  # Brightness, R, G, B
-    for i, value in enumerate(rgb_values):
-        await updater.update_property(
-            device_id="rgb_light",
-            property_type=StatePropertyType.CHANNEL_VALUE.value,
-            value=value,
-            index=i,
-        )
-    print(f"✓ Updated 4 channel values (RGBW)")
+    # Persist all updates below with a single storage write
+    async with updater.batch():
+        # 8-button control panel
+        device_id = "button_panel_8"
+        
+        for i in range(8):
+            await updater.update_property(
+                device_id=device_id,
+                property_type=StatePropertyType.BUTTON_VALUE.value,
+                value=False,  # All buttons released
+                index=i,
+                persist_state=False,  # Don't persist button events
+            )
+        _report(f"✓ Updated 8 button values")
+        
+        # Multi-zone climate system (3 zones)
+        # Each zone is a separate device, so the pushes can run concurrently
+        await asyncio.gather(*(
+            updater.update_property(
+                device_id=f"climate_zone_{zone_idx}",
+                property_type=StatePropertyType.CONTROL_HEATING_LEVEL.value,
+                value=20.0 + zone_idx,  # Different temp per zone
+                index=0,
+            )
+            for zone_idx in range(3)
+        ))
+        _report(f"✓ Updated 3 zone heating levels")
+        
+        # RGB+W light (4 channels)
+        rgb_values = [100.0, 255.0, 128.0, 64.0]  # Brightness, R, G, B
+        for i, value in enumerate(rgb_values):
+            await updater.update_property(
+                device_id="rgb_light",
+                property_type=StatePropertyType.CHANNEL_VALUE.value,
+                value=value,
+                index=i,
+            )
+        _report(f"✓ Updated 4 channel values (RGBW)")
 
 
 async def example_7_connection_status_update(
@@ -305,7 +329,7 @@ async def example_7_connection_status_update(
         value="connected",
         persist_state=True,  # Persist to show status after restart
     )
-    print(f"✓ Updated connection_status to 'connected'")
+    _report(f"✓ Updated connection_status to 'connected'")
     
     # Update system status
     await updater.update_property(
@@ -314,7 +338,7 @@ async def example_7_connection_status_update(
         value="operational",
         persist_state=True,
     )
-    print(f"✓ Updated system_status to 'operational'")
+    _report(f"✓ Updated system_status to 'operational'")
     
     # Update programming mode
     await updater.update_property(
@@ -323,7 +347,7 @@ async def example_7_connection_status_update(
         value=False,
         persist_state=True,
     )
-    print(f"✓ Updated progMode to False")
+    _report(f"✓ Updated progMode to False")
 
 
 async def example_8_error_handling(
@@ -343,7 +367,7 @@ async def example_8_error_handling(
             value="Test",
         )
     except PropertyUpdateError as e:
-        print(f"✓ Caught expected error: {e}")
+        _report(f"✓ Caught expected error: {e}")
     
     # Try to update with invalid value type (will be logged but may succeed)
     try:
@@ -354,7 +378,7 @@ async def example_8_error_handling(
             index=0,
         )
     except Exception as e:
-        print(f"✓ Caught type error: {e}")
+        _report(f"✓ Caught type error: {e}")
 
 
 async def example_9_complete_workflow(
@@ -390,10 +414,10 @@ async def example_9_complete_workflow(
         }
     )
     storage.add_device(device)
-    print(f"✓ Created device: {device.name}")
+    _report(f"✓ Created device: {device.name}")
     
-    # 2. Initialize property updater
-    updater = PropertyUpdater(hass, storage)
+    # 2. Get the (shared) property updater
+    updater = _get_updater(hass, storage)
     
     # 3. Update CONFIG properties (device settings)
     await updater.config_updater.update_config_property(
@@ -402,36 +426,26 @@ async def example_9_complete_workflow(
         value="Master Brightness",
         index=0,
     )
-    print(f"✓ Configured channel descriptions")
+    _report(f"✓ Configured channel descriptions")
     
     # 4. Update STATE properties (runtime values)
     # Set initial color: White at 50% brightness
-    state_updates = {
-        (StatePropertyType.CHANNEL_VALUE, 0): 50.0,   # Brightness
-        (StatePropertyType.CHANNEL_VALUE, 1): 255.0,  # Red
-        (StatePropertyType.CHANNEL_VALUE, 2): 255.0,  # Green
-        (StatePropertyType.CHANNEL_VALUE, 3): 255.0,  # Blue
-    }
+    state_updates = dict(zip(_RGBW_KEYS, (50.0, 255.0, 255.0, 255.0)))
     await updater.state_updater.update_multiple_state_properties(
         device_id=device.device_id,
         updates=state_updates,
         persist=True,
     )
-    print(f"✓ Set initial color to white at 50%")
+    _report(f"✓ Set initial color to white at 50%")
     
     # 5. Simulate color change: Blue at full brightness
-    state_updates = {
-        (StatePropertyType.CHANNEL_VALUE, 0): 100.0,  # Brightness to 100%
-        (StatePropertyType.CHANNEL_VALUE, 1): 0.0,    # Red off
-        (StatePropertyType.CHANNEL_VALUE, 2): 0.0,    # Green off
-        (StatePropertyType.CHANNEL_VALUE, 3): 255.0,  # Blue full
-    }
+    state_updates = dict(zip(_RGBW_KEYS, (100.0, 0.0, 0.0, 255.0)))
     await updater.state_updater.update_multiple_state_properties(
         device_id=device.device_id,
         updates=state_updates,
         persist=True,
     )
-    print(f"✓ Changed color to blue at full brightness")
+    _report(f"✓ Changed color to blue at full brightness")
     
     print(f"\n✓ Workflow complete - all changes persisted to YAML")
 
@@ -456,5 +470,20 @@ async def main():
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
+    import contextlib
+    import io
+    import sys
+    
+    # Use uvloop's faster event loop when it is installed
+    try:
+        from uvloop import run
+    except ImportError:
+        run = asyncio.run
+    
+    # Collect all output and emit it with a single write
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            run(main())
+    finally:
+        sys.stdout.write(buffer.getvalue())
@@ -180,7 +180,7 @@ def example_manager_usage():
     # Initialize manager
     manager = StateListenerManager(
         hass=hass,
-        mapping_file=Path("/config/virtual_digitalstrom_listener_mappings.yaml"),
+        mapping_file=Path("/config/virtual_digitalstrom_listener_mappings.json"),
     )
     
     # Add global callback for all state updates
@@ -525,7 +525,7 @@ When a device is created/loaded, the system automatically:
 
 3. Auto-creates 9 listeners (4 channels + 3 buttons + 2 sensors)
 
-4. Saves mappings to virtual_digitalstrom_listener_mappings.yaml
+4. Saves mappings to virtual_digitalstrom_listener_mappings.json
 
 5. Starts all listeners to begin tracking
 
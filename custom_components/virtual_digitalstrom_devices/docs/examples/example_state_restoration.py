@@ -11,22 +11,53 @@ NOTE: This is a simplified demonstration without Home Assistant.
 For actual HA integration testing, use Home Assistant's test framework.
 """
 
+import contextlib
+import functools
+import io
+import os
+import re
+import shutil
 import sys
 from pathlib import Path
 import tempfile
 import yaml
 
+# Example directory, resolved once
+_HERE = Path(__file__).resolve().parent
+
 # For standalone execution, add current directory to path
 if __name__ == "__main__":
-    current_dir = Path(__file__).parent
-    if str(current_dir) not in sys.path:
-        sys.path.insert(0, str(current_dir))
+    if str(_HERE) not in sys.path:
+        sys.path.insert(0, str(_HERE))
 
 # Direct module imports for standalone execution
 import virtual_device
 import device_storage
 import device_classes
 
+# The raw YAML dump is only echoed when VDS_EXAMPLES_VERBOSE=1
+VERBOSE = os.environ.get("VDS_EXAMPLES_VERBOSE") == "1"
+
+# Section separator for the example output
+_SEP = "=" * 60
+
+# State key pattern: "property.name[index]" or "property.name"
+_STATE_KEY_RE = re.compile(r"^(.+?)(?:\[(\d+)\])?$")
+
+
+@functools.lru_cache(maxsize=2048)
+def parse_state_key(key):
+    """Parse a state key into property type and optional index."""
+    match = _STATE_KEY_RE.match(key)
+    
+    if not match:
+        return None, None
+    
+    property_type_str, index_str = match.groups()
+    index = int(index_str) if index_str else None
+    
+    return property_type_str, index
+
 
 def create_test_device_with_state():
     """Create a test device with persisted STATE values."""
@@ -121,8 +152,7 @@ def main():
         light = create_test_device_with_state()
         climate = create_test_climate_device_with_state()
         
-        storage.add_device(light)
-        storage.add_device(climate)
+        storage.add_devices([light, climate])
         
         print(f"✓ Created and saved 2 devices to {storage_file}\n")
         
@@ -136,19 +166,21 @@ def main():
             print(f"  {key}: {data['value']}")
         
         # === STEP 2: Show YAML content ===
-        print(f"\n{'='*60}")
-        print("YAML Storage Content:")
-        print(f"{'='*60}")
-        with open(storage_file, 'r') as f:
-            yaml_content = f.read()
-            print(yaml_content)
+        if VERBOSE:
+            print(f"\n{_SEP}")
+            print("YAML Storage Content:")
+            print(_SEP)
+            # Stream the file instead of reading it into one string
+            with open(storage_file, 'r') as f:
+                shutil.copyfileobj(f, sys.stdout)
         
         # === STEP 3: Simulate restart - load devices from YAML ===
-        print(f"{'='*60}")
+        print(f"\n{_SEP}")
         print("\nSTEP 2: Simulating restart - loading devices from storage...")
         
         # Create new storage instance (simulates restart)
         storage2 = device_storage.DeviceStorage(storage_file)
+        storage2.load()
         
         # Verify devices were loaded
         loaded_devices = storage2.get_all_devices()
@@ -171,24 +203,9 @@ def main():
                 print("  No STATE values found")
         
         # === STEP 5: Demonstrate parsing state keys ===
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP}")
         print("STEP 4: Demonstrating state key parsing...")
-        print(f"{'='*60}\n")
-        
-        import re
-        
-        def parse_state_key(key):
-            """Parse a state key into property type and optional index."""
-            pattern = r"^(.+?)(?:\[(\d+)\])?$"
-            match = re.match(pattern, key)
-            
-            if not match:
-                return None, None
-            
-            property_type_str, index_str = match.groups()
-            index = int(index_str) if index_str else None
-            
-            return property_type_str, index
+        print(f"{_SEP}\n")
         
         test_keys = [
             "channel.value[0]",
@@ -203,9 +220,9 @@ def main():
             print(f"  '{key}' -> property_type='{prop_type}', index={index}")
         
         # === SUCCESS ===
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP}")
         print("✓ Example completed successfully!")
-        print(f"{'='*60}\n")
+        print(f"{_SEP}\n")
         
         print("Summary:")
         print("1. Created devices with persisted STATE values")
@@ -225,4 +242,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    # Collect all output and emit it with a single write
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            main()
+    finally:
+        sys.stdout.write(buffer.getvalue())
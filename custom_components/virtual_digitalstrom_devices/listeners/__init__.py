@@ -5,12 +5,64 @@ Home Assistant entity state changes and synchronizing with
 virtual digitalSTROM devices.
 """
 
-from .device_listener_configurator import DeviceListenerConfigurator
-from .state_listener import *
-from .state_listener_manager import StateListenerManager
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from . import state_listener
+from .state_listener import (
+    AttributeStateListener,
+    BooleanStateListener,
+    EnumStateListener,
+    IntegerStateListener,
+    NumericStateListener,
+    StateListener,
+    StatePropertyType,
+    StateUpdate,
+    StringStateListener,
+    create_button_value_listener,
+    create_channel_value_listener,
+    create_connection_status_listener,
+    create_control_value_listener,
+    create_sensor_value_listener,
+)
+
+if TYPE_CHECKING:
+    from .device_listener_configurator import DeviceListenerConfigurator
+    from .state_listener_manager import StateListenerManager
 
 __all__ = [
     "StateListenerManager",
     "DeviceListenerConfigurator",
+    "StateListener",
+    "StatePropertyType",
+    "StateUpdate",
+    "AttributeStateListener",
+    "BooleanStateListener",
+    "EnumStateListener",
+    "IntegerStateListener",
+    "NumericStateListener",
+    "StringStateListener",
+    "create_button_value_listener",
+    "create_channel_value_listener",
+    "create_connection_status_listener",
+    "create_control_value_listener",
+    "create_sensor_value_listener",
     "state_listener",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the manager and configurator on first access.
+    
+    Modules that only need StatePropertyType (e.g. the storage layer) import
+    this package too, so the heavier listener wiring is deferred until the
+    integration actually sets up listeners.
+    """
+    if name == "StateListenerManager":
+        from .state_listener_manager import StateListenerManager
+        return StateListenerManager
+    if name == "DeviceListenerConfigurator":
+        from .device_listener_configurator import DeviceListenerConfigurator
+        return DeviceListenerConfigurator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
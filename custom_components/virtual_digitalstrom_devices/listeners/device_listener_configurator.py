@@ -7,8 +7,12 @@ device implements.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Optional
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, NamedTuple, Optional
 
 from homeassistant.core import HomeAssistant
 
@@ -28,6 +32,212 @@ from ..models.virtual_device import VirtualDevice
 _LOGGER = logging.getLogger(__name__)
 
 
+class ParsedPath(NamedTuple):
+    """Components of a listener property path."""
+    
+    property_type: str
+    category: str
+    property: str
+    index: Optional[int] = None
+    attribute: Optional[str] = None
+
+
+def _is_word(text: str) -> bool:
+    """Check that text is non-empty and only has letters, digits and underscores."""
+    return bool(text) and text.replace("_", "a").isalnum()
+
+
+@lru_cache(maxsize=2048)
+def _parse_property_path(path: str) -> Optional[ParsedPath]:
+    """Parse a property path into components.
+    
+    Cached because the same paths (e.g. "button[0].value") repeat across devices.
+    
+    Examples:
+        "button[0].value" -> ParsedPath("button.value", "button", "value", index=0)
+        "channel[0].value@red" -> ParsedPath("channel.value", "channel", "value", 0, "red")
+        "control.heatingLevel" -> ParsedPath("control.heatingLevel", "control", "heatingLevel")
+    
+    Args:
+        path: Property path string
+        
+    Returns:
+        Parsed components or None if invalid
+    """
+    # Grammar: category[index].property@attribute (index and attribute optional)
+    head, dot, tail = path.partition(".")
+    if not dot:
+        return None
+    
+    property_name, at, attribute = tail.partition("@")
+    if not _is_word(property_name) or (at and not _is_word(attribute)):
+        return None
+    
+    index_str = None
+    if head.endswith("]"):
+        category, bracket, index_str = head[:-1].partition("[")
+        if not bracket or not index_str.isdecimal():
+            return None
+    else:
+        category = head
+    if not _is_word(category):
+        return None
+    
+    # Interned so the dispatch lookup matches the (interned) literal keys by identity
+    return ParsedPath(
+        property_type=sys.intern(f"{category}.{property_name}"),
+        category=category,
+        property=property_name,
+        index=int(index_str) if index_str else None,
+        attribute=attribute or None,
+    )
+
+
+@lru_cache(maxsize=4096)
+def _entity_id_lower(entity_id: str) -> str:
+    """Lowercase an entity ID for name matching.
+    
+    Cached because default mappings are created for every device against the
+    same set of HA entities, and again on every reload.
+    """
+    return sys.intern(entity_id.lower())
+
+
+# Recommended entity domains per device group (from DEVICE_CLASSES.md). Each
+# builder gets the number of buttons, binary inputs, sensors and channels;
+# domain tuples are constants, so they are shared rather than allocated.
+Recommendations = dict[str, tuple[str, ...]]
+
+
+def _recommend_lights(num_buttons: int, num_binary_inputs: int, num_sensors: int, num_channels: int) -> Recommendations:
+    """Group 1: Lights."""
+    recommendations: Recommendations = {}
+    # Typically 1 brightness channel, possibly color channels
+    for i in range(num_channels or 1):
+        recommendations[f"channel[{i}].value"] = ("light",)
+    # Power consumption sensor
+    for i in range(num_sensors or 1):
+        recommendations[f"sensor[{i}].value"] = ("sensor",)
+    # Physical buttons (if any)
+    for i in range(num_buttons):
+        recommendations[f"button[{i}].value"] = ("binary_sensor", "switch")
+    return recommendations
+
+
+def _recommend_blinds(num_buttons: int, num_binary_inputs: int, num_sensors: int, num_channels: int) -> Recommendations:
+    """Group 2: Blinds/Shades."""
+    # Position channel
+    recommendations: Recommendations = {"channel[0].value": ("cover",)}
+    # Tilt angle channel (if exists) and additional channels
+    for i in range(1, num_channels):
+        recommendations[f"channel[{i}].value"] = ("cover",)
+    # Up/down buttons
+    for i in range(num_buttons):
+        recommendations[f"button[{i}].value"] = ("binary_sensor",)
+    return recommendations
+
+
+def _recommend_heating(num_buttons: int, num_binary_inputs: int, num_sensors: int, num_channels: int) -> Recommendations:
+    """Group 3: Heating (Climate)."""
+    recommendations: Recommendations = {"control.heatingLevel": ("climate",)}
+    # Temperature sensors
+    for i in range(num_sensors or 1):
+        recommendations[f"sensor[{i}].value"] = ("sensor",)
+    # Valve position channel (if exists)
+    for i in range(num_channels):
+        recommendations[f"channel[{i}].value"] = ("climate", "sensor")
+    return recommendations
+
+
+def _recommend_audio(num_buttons: int, num_binary_inputs: int, num_sensors: int, num_channels: int) -> Recommendations:
+    """Group 4: Audio."""
+    # Volume channel
+    recommendations: Recommendations = {"channel[0].value": ("media_player",)}
+    # Additional channels (bass, treble, etc.)
+    for i in range(1, num_channels):
+        recommendations[f"channel[{i}].value"] = ("media_player", "number")
+    # Control buttons
+    for i in range(num_buttons):
+        recommendations[f"button[{i}].value"] = ("binary_sensor",)
+    return recommendations
+
+
+def _recommend_video(num_buttons: int, num_binary_inputs: int, num_sensors: int, num_channels: int) -> Recommendations:
+    """Group 5: Video."""
+    recommendations: Recommendations = {}
+    for i in range(num_channels or 1):
+        recommendations[f"channel[{i}].value"] = ("media_player",)
+    for i in range(num_buttons):
+        recommendations[f"button[{i}].value"] = ("binary_sensor",)
+    return recommendations
+
+
+def _recommend_joker(num_buttons: int, num_binary_inputs: int, num_sensors: int, num_channels: int) -> Recommendations:
+    """Group 8: Joker/Generic - most flexible."""
+    recommendations: Recommendations = {}
+    for i in range(num_sensors or 1):
+        recommendations[f"sensor[{i}].value"] = ("sensor",)
+    for i in range(num_binary_inputs):
+        recommendations[f"binary[{i}].value"] = ("binary_sensor",)
+    for i in range(num_buttons):
+        recommendations[f"button[{i}].value"] = ("binary_sensor", "switch")
+    for i in range(num_channels):
+        recommendations[f"channel[{i}].value"] = ("light", "switch", "number")
+    return recommendations
+
+
+def _recommend_cooling(num_buttons: int, num_binary_inputs: int, num_sensors: int, num_channels: int) -> Recommendations:
+    """Group 9: Cooling/Ventilation."""
+    recommendations: Recommendations = {
+        "control.coolingLevel": ("climate",),
+        "control.ventilationLevel": ("fan",),
+    }
+    for i in range(num_sensors or 1):
+        recommendations[f"sensor[{i}].value"] = ("sensor",)
+    for i in range(num_channels):
+        recommendations[f"channel[{i}].value"] = ("climate", "fan")
+    return recommendations
+
+
+_GROUP_RECOMMENDERS: dict[int, Callable[[int, int, int, int], Recommendations]] = {
+    1: _recommend_lights,
+    2: _recommend_blinds,
+    3: _recommend_heating,
+    4: _recommend_audio,
+    5: _recommend_video,
+    8: _recommend_joker,
+    9: _recommend_cooling,
+}
+
+
+@lru_cache(maxsize=256)
+def _recommend_mappings(
+    group_id: int,
+    num_buttons: int,
+    num_binary_inputs: int,
+    num_sensors: int,
+    num_channels: int,
+) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Build the recommended entity domains per property path.
+    
+    Cached because every device of the same class and size gets the same
+    recommendations; the result is immutable so it can be shared.
+    
+    Returns:
+        Tuple of (property path, recommended entity domains) pairs
+    """
+    builder = _GROUP_RECOMMENDERS.get(group_id)
+    recommendations = (
+        builder(num_buttons, num_binary_inputs, num_sensors, num_channels) if builder else {}
+    )
+    
+    # Add common recommendations for all devices
+    recommendations["device.connection_status"] = ("binary_sensor",)
+    recommendations["device.progMode"] = ("input_boolean",)
+    
+    return tuple(recommendations.items())
+
+
 class DeviceListenerConfigurator:
     """Configures state listeners for virtual devices based on their properties.
     
@@ -36,8 +246,9 @@ class DeviceListenerConfigurator:
     implements (buttons, sensors, channels, outputs, control values, etc.).
     """
     
-    # Mapping of property patterns to listener classes
-    PROPERTY_LISTENER_MAP = {
+    # Mapping of property patterns to listener classes (read-only, since
+    # _PROPERTY_DISPATCH below is derived from it once at class creation)
+    PROPERTY_LISTENER_MAP = MappingProxyType({
         "button.value": BooleanStateListener,
         "button.error": EnumStateListener,
         "button.actionId": IntegerStateListener,
@@ -64,7 +275,14 @@ class DeviceListenerConfigurator:
         "deviceState.value": StringStateListener,
         "deviceProperty.name": StringStateListener,
         "deviceProperty.value": StringStateListener,
-    }
+    })
+    
+    # Property type string -> (StatePropertyType, listener class), so a single
+    # lookup resolves both without going through the enum constructor
+    _PROPERTY_DISPATCH = MappingProxyType({
+        key: (StatePropertyType(key), listener_class)
+        for key, listener_class in PROPERTY_LISTENER_MAP.items()
+    })
     
     def __init__(self, hass: HomeAssistant, manager: StateListenerManager):
         """Initialize the configurator.
@@ -97,7 +315,6 @@ class DeviceListenerConfigurator:
         Returns:
             Number of listeners created
         """
-        listener_count = 0
         device_id = device.device_id
         
         _LOGGER.info(
@@ -106,24 +323,25 @@ class DeviceListenerConfigurator:
             device_id,
         )
         
-        # Process each entity mapping
-        for property_path, entity_id in entity_mappings.items():
-            try:
-                listener = await self._create_listener_for_property(
-                    device_id=device_id,
-                    property_path=property_path,
-                    entity_id=entity_id,
-                )
-                if listener:
-                    listener_count += 1
-            except Exception as err:
-                _LOGGER.error(
-                    "Error creating listener for %s -> %s: %s",
+        # Create all listeners concurrently; a failing mapping is logged and
+        # returns None without affecting the others (tasks start in mapping
+        # order, so duplicates resolve as before)
+        create_listener = self._create_listener_for_property
+        listeners = await asyncio.gather(
+            *[
+                create_listener(
+                    device_id,
                     property_path,
-                    entity_id,
-                    err,
-                    exc_info=True,
+                    # Devices often share entities; keep one copy of each id
+                    sys.intern(entity_id) if isinstance(entity_id, str) else entity_id,
                 )
+                for property_path, entity_id in entity_mappings.items()
+            ]
+        )
+        listener_count = len(listeners) - listeners.count(None)
+        if listener_count:
+            # Persist the new mappings once for the whole device
+            self.manager.async_schedule_save()
         
         _LOGGER.info(
             "Created %d state listeners for device %s",
@@ -147,41 +365,47 @@ class DeviceListenerConfigurator:
             entity_id: Home Assistant entity ID to track
             
         Returns:
-            Created listener or None if property type not supported
+            Created listener or None if property type not supported or
+            the listener could not be created
         """
         # Parse property path to extract type, index, and property name
-        parts = self._parse_property_path(property_path)
+        parts = _parse_property_path(property_path)
         if not parts:
             _LOGGER.warning("Invalid property path: %s", property_path)
             return None
         
-        property_type_str = parts["property_type"]
-        index = parts.get("index")
-        attribute_name = parts.get("attribute")
+        property_type_str = parts.property_type
+        index = parts.index
+        attribute_name = parts.attribute
         
-        # Get property type enum
-        try:
-            property_type = StatePropertyType(property_type_str)
-        except ValueError:
+        # Get property type enum and listener class
+        dispatch = self._PROPERTY_DISPATCH.get(property_type_str)
+        if dispatch is None:
             _LOGGER.warning("Unknown property type: %s", property_type_str)
             return None
-        
-        # Get listener class
-        listener_class = self.PROPERTY_LISTENER_MAP.get(property_type_str)
-        if not listener_class:
-            _LOGGER.warning("No listener class for property type: %s", property_type_str)
-            return None
+        property_type, listener_class = dispatch
         
         # Create and register listener
-        listener = await self.manager.async_add_listener(
-            device_id=device_id,
-            entity_id=entity_id,
-            property_type=property_type,
-            listener_class=listener_class,
-            index=index,
-            attribute_name=attribute_name,
-            auto_start=True,
-        )
+        try:
+            listener = await self.manager.async_add_listener(
+                device_id=device_id,
+                entity_id=entity_id,
+                property_type=property_type,
+                listener_class=listener_class,
+                index=index,
+                attribute_name=attribute_name,
+                auto_start=True,
+            )
+        except Exception as err:
+            _LOGGER.error(
+                "Error creating listener for %s -> %s: %s",
+                property_path,
+                entity_id,
+                err,
+                # Full traceback only when debugging; the message names the error
+                exc_info=_LOGGER.isEnabledFor(logging.DEBUG),
+            )
+            return None
         
         _LOGGER.debug(
             "Created listener: %s[%s] -> %s (%s)",
@@ -193,50 +417,6 @@ class DeviceListenerConfigurator:
         
         return listener
     
-    def _parse_property_path(self, path: str) -> Optional[dict[str, Any]]:
-        """Parse a property path into components.
-        
-        Examples:
-            "button[0].value" -> {property_type: "button.value", index: 0}
-            "sensor[1].value" -> {property_type: "sensor.value", index: 1}
-            "channel[0].value" -> {property_type: "channel.value", index: 0}
-            "control.heatingLevel" -> {property_type: "control.heatingLevel"}
-            "device.progMode" -> {property_type: "device.progMode"}
-        
-        Args:
-            path: Property path string
-            
-        Returns:
-            Dictionary with parsed components or None if invalid
-        """
-        import re
-        
-        # Pattern: category[index].property or category.property
-        pattern = r"^(\w+)(?:\[(\d+)\])?\.(\w+)(?:@(\w+))?$"
-        match = re.match(pattern, path)
-        
-        if not match:
-            return None
-        
-        category, index_str, property_name, attribute = match.groups()
-        
-        # Build property type string
-        property_type = f"{category}.{property_name}"
-        
-        result = {
-            "property_type": property_type,
-            "category": category,
-            "property": property_name,
-        }
-        
-        if index_str:
-            result["index"] = int(index_str)
-        
-        if attribute:
-            result["attribute"] = attribute
-        
-        return result
-    
     async def async_configure_from_device_attributes(
         self,
         device: VirtualDevice,
@@ -261,7 +441,8 @@ class DeviceListenerConfigurator:
         Returns:
             Number of listeners created
         """
-        entity_mappings = device.attributes.get("entity_mappings", {})
+        # No default dict needed: a missing key and an empty mapping both mean no listeners
+        entity_mappings = device.attributes.get("entity_mappings") if device.attributes else None
         
         if not entity_mappings:
             _LOGGER.debug(
@@ -278,125 +459,59 @@ class DeviceListenerConfigurator:
     ) -> dict[str, list[str]]:
         """Get recommended entity types for device properties.
         
-        Based on the device's group_id and modelFeatures, suggests what
-        types of HA entities should be mapped to each property.
-        
-        This handles multiple instances of the same property type.
-        For example, a device might have:
-        - 3 buttons (button[0], button[1], button[2])
-        - 2 sensors (sensor[0], sensor[1])
-        - 4 channels (channel[0], channel[1], channel[2], channel[3])
+        See the module-level get_recommended_mappings().
         
         Args:
             device: Virtual device instance
             
         Returns:
             Dictionary mapping property paths to lists of recommended entity domains
-            
-        Example:
-            {
-                "button[0].value": ["binary_sensor", "input_boolean"],
-                "button[1].value": ["binary_sensor", "input_boolean"],
-                "sensor[0].value": ["sensor"],
-                "sensor[1].value": ["sensor"],
-                "channel[0].value": ["light", "switch"],
-                "channel[1].value": ["light", "switch"],
-                "control.heatingLevel": ["climate"],
-            }
         """
-        recommendations = {}
-        
-        # Get device attributes to determine how many instances of each property type
-        attributes = device.attributes or {}
-        
-        # Determine number of buttons, sensors, channels from attributes
-        num_buttons = attributes.get("num_buttons", 0)
-        num_binary_inputs = attributes.get("num_binary_inputs", 0)
-        num_sensors = attributes.get("num_sensors", 0)
-        num_channels = attributes.get("num_channels", 0)
-        
-        # Based on device group (from DEVICE_CLASSES.md)
-        group_id = device.group_id
-        
-        # Group 1: Lights
-        if group_id == 1:
-            # Typically 1 brightness channel, possibly color channels
-            for i in range(num_channels or 1):
-                recommendations[f"channel[{i}].value"] = ["light"]
-            # Power consumption sensor
-            for i in range(num_sensors or 1):
-                recommendations[f"sensor[{i}].value"] = ["sensor"]
-            # Physical buttons (if any)
-            for i in range(num_buttons):
-                recommendations[f"button[{i}].value"] = ["binary_sensor", "switch"]
-        
-        # Group 2: Blinds/Shades
-        elif group_id == 2:
-            # Position channel
-            recommendations["channel[0].value"] = ["cover"]
-            # Tilt angle channel (if exists)
-            if num_channels > 1:
-                recommendations["channel[1].value"] = ["cover"]
-            # Additional channels
-            for i in range(2, num_channels):
-                recommendations[f"channel[{i}].value"] = ["cover"]
-            # Up/down buttons
-            for i in range(num_buttons):
-                recommendations[f"button[{i}].value"] = ["binary_sensor"]
-        
-        # Group 3: Heating (Climate)
-        elif group_id == 3:
-            recommendations["control.heatingLevel"] = ["climate"]
-            # Temperature sensors
-            for i in range(num_sensors or 1):
-                recommendations[f"sensor[{i}].value"] = ["sensor"]
-            # Valve position channel (if exists)
-            for i in range(num_channels):
-                recommendations[f"channel[{i}].value"] = ["climate", "sensor"]
-        
-        # Group 4: Audio
-        elif group_id == 4:
-            # Volume channel
-            recommendations["channel[0].value"] = ["media_player"]
-            # Additional channels (bass, treble, etc.)
-            for i in range(1, num_channels):
-                recommendations[f"channel[{i}].value"] = ["media_player", "number"]
-            # Control buttons
-            for i in range(num_buttons):
-                recommendations[f"button[{i}].value"] = ["binary_sensor"]
-        
-        # Group 5: Video
-        elif group_id == 5:
-            for i in range(num_channels or 1):
-                recommendations[f"channel[{i}].value"] = ["media_player"]
-            for i in range(num_buttons):
-                recommendations[f"button[{i}].value"] = ["binary_sensor"]
-        
-        # Group 8: Joker/Generic - most flexible
-        elif group_id == 8:
-            for i in range(num_sensors or 1):
-                recommendations[f"sensor[{i}].value"] = ["sensor"]
-            for i in range(num_binary_inputs):
-                recommendations[f"binary[{i}].value"] = ["binary_sensor"]
-            for i in range(num_buttons):
-                recommendations[f"button[{i}].value"] = ["binary_sensor", "switch"]
-            for i in range(num_channels):
-                recommendations[f"channel[{i}].value"] = ["light", "switch", "number"]
-        
-        # Group 9: Cooling/Ventilation
-        elif group_id == 9:
-            recommendations["control.coolingLevel"] = ["climate"]
-            recommendations["control.ventilationLevel"] = ["fan"]
-            for i in range(num_sensors or 1):
-                recommendations[f"sensor[{i}].value"] = ["sensor"]
-            for i in range(num_channels):
-                recommendations[f"channel[{i}].value"] = ["climate", "fan"]
+        return get_recommended_mappings(device)
+
+
+def get_recommended_mappings(device: VirtualDevice) -> dict[str, list[str]]:
+    """Get recommended entity types for device properties.
+    
+    Based on the device's group_id and modelFeatures, suggests what
+    types of HA entities should be mapped to each property.
+    
+    This handles multiple instances of the same property type.
+    For example, a device might have:
+    - 3 buttons (button[0], button[1], button[2])
+    - 2 sensors (sensor[0], sensor[1])
+    - 4 channels (channel[0], channel[1], channel[2], channel[3])
+    
+    Args:
+        device: Virtual device instance
         
-        # Add common recommendations for all devices
-        recommendations["device.connection_status"] = ["binary_sensor"]
-        recommendations["device.progMode"] = ["input_boolean"]
+    Returns:
+        Dictionary mapping property paths to lists of recommended entity domains
         
-        return recommendations
+    Example:
+        {
+            "button[0].value": ["binary_sensor", "input_boolean"],
+            "button[1].value": ["binary_sensor", "input_boolean"],
+            "sensor[0].value": ["sensor"],
+            "sensor[1].value": ["sensor"],
+            "channel[0].value": ["light", "switch"],
+            "channel[1].value": ["light", "switch"],
+            "control.heatingLevel": ["climate"],
+        }
+    """
+    # Get device attributes to determine how many instances of each property type
+    attributes = device.attributes or {}
+    
+    recommendations = _recommend_mappings(
+        device.group_id,
+        attributes.get("num_buttons", 0),
+        attributes.get("num_binary_inputs", 0),
+        attributes.get("num_sensors", 0),
+        attributes.get("num_channels", 0),
+    )
+    
+    # Fresh lists, so callers may modify the result
+    return {path: list(domains) for path, domains in recommendations}
 
 
 def create_default_entity_mappings(
@@ -428,21 +543,30 @@ def create_default_entity_mappings(
         #     "sensor[0].value": "sensor.living_room_power",
         # }
     """
-    configurator = DeviceListenerConfigurator(None, None)
-    recommendations = configurator.get_recommended_mappings(device)
+    recommendations = get_recommended_mappings(device)
+    
+    # Index the entities by domain once: the first entity of each domain and
+    # the first one whose id contains the device name. Positions are kept so
+    # that picking across several recommended domains still returns the
+    # entity that comes first in ha_entities.
+    name_slug = device.name.lower().replace(" ", "_")
+    first_by_domain: dict[str, tuple[int, str]] = {}
+    named_by_domain: dict[str, tuple[int, str]] = {}
+    for position, (entity_id, domain) in enumerate(ha_entities.items()):
+        first_by_domain.setdefault(domain, (position, entity_id))
+        if domain not in named_by_domain and name_slug in _entity_id_lower(entity_id):
+            named_by_domain[domain] = (position, entity_id)
     
     mappings = {}
     
     # Try to find matching entities for each recommended property
     for property_path, recommended_domains in recommendations.items():
-        for entity_id, domain in ha_entities.items():
-            if domain in recommended_domains:
-                # Simple heuristic: prefer entities with matching names
-                if device.name.lower().replace(" ", "_") in entity_id.lower():
-                    mappings[property_path] = entity_id
-                    break
-                # Or just use first matching domain
-                elif property_path not in mappings:
-                    mappings[property_path] = entity_id
+        # Simple heuristic: prefer entities with matching names,
+        # or just use first matching domain
+        for by_domain in (named_by_domain, first_by_domain):
+            candidates = [by_domain[domain] for domain in recommended_domains if domain in by_domain]
+            if candidates:
+                mappings[property_path] = min(candidates)[1]
+                break
     
     return mappings
@@ -172,7 +172,9 @@ class StateListener(ABC):
             self._last_value = self.extract_value(state)
             _LOGGER.debug("Initial value for %s: %s", self.entity_id, self._last_value)
         
-        # Subscribe to state changes
+        # Subscribe to state changes. HA routes these events through a dict
+        # keyed by entity_id, so one subscription per listener costs the same
+        # as a shared multi-entity subscription and keeps stop() independent.
         self._unsubscribe = async_track_state_change_event(
             self.hass,
             self.entity_id,
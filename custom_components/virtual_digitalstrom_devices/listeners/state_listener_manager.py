@@ -1,19 +1,44 @@
 """State listener manager for coordinating state tracking across virtual devices.
 
 This module provides a centralized manager for all state listeners, enabling
-UI-based mapping configuration and coordinated state persistence.
+UI-based mapping configuration and coordinated state persistence. Listener
+mappings are stored as JSON for a ".json" mapping file (using orjson when
+available) and as YAML otherwise.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import os
+import sys
+from collections import Counter
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any, Callable, Optional
 
 import yaml
 
-from homeassistant.core import HomeAssistant
+# libyaml-backed loader/dumper when available (several times faster)
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore
+
+# Streams mapping records out of large JSON mapping files when installed
+try:
+    import ijson
+except ImportError:  # pragma: no cover - ijson is optional
+    ijson = None  # type: ignore
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
 
 from .state_listener import (
     AttributeStateListener,
@@ -29,8 +54,21 @@ from .state_listener import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds to wait before a scheduled mapping save, so bursts of changes are
+# written once
+SAVE_DELAY = 1.0
+
+# Listener key: (device_id, property type value, index)
+ListenerKey = tuple[str, str, Optional[int]]
 
-@dataclass
+# STATE property types by value, so stored mappings resolve without
+# raising and catching ValueError for unknown types
+_STATE_PROPERTY_TYPES: dict[str, StatePropertyType] = {
+    property_type.value: property_type for property_type in StatePropertyType
+}
+
+
+@dataclass(slots=True)
 class ListenerMapping:
     """Configuration for a state listener mapping."""
     
@@ -76,7 +114,7 @@ class StateListenerManager:
     
     This manager handles:
     - Creating and registering state listeners
-    - Loading/saving listener mappings from YAML
+    - Loading/saving listener mappings from JSON or YAML
     - Coordinating state updates across listeners
     - Providing callbacks for state persistence
     """
@@ -100,13 +138,25 @@ class StateListenerManager:
         
         Args:
             hass: Home Assistant instance
-            mapping_file: Optional path to YAML file for listener mappings
+            mapping_file: Optional path to the listener mappings file
+                (JSON for a ".json" suffix, YAML otherwise)
         """
         self.hass = hass
         self.mapping_file = mapping_file
-        self._listeners: dict[str, StateListener] = {}  # key: f"{device_id}:{property_type}:{index}"
-        self._mappings: dict[str, ListenerMapping] = {}
-        self._state_update_callbacks: list[Callable[[StateUpdate], None]] = []
+        self._listeners: dict[ListenerKey, StateListener] = {}
+        # Mappings are kept in their serialized form: they never change once
+        # added, so saving doesn't have to convert each one again
+        self._mappings: dict[ListenerKey, dict[str, Any]] = {}
+        # Secondary index: device ID -> {key: listener}, so per-device lookups
+        # don't scan every listener
+        self._listeners_by_device: dict[str, dict[ListenerKey, StateListener]] = {}
+        # Immutable, so dispatch iterates a snapshot and callbacks may be
+        # added or removed while an update is being delivered
+        self._state_update_callbacks: tuple[Callable[[StateUpdate], None], ...] = ()
+        # Cancels the pending scheduled save, if any
+        self._cancel_scheduled_save: Optional[Callable[[], None]] = None
+        # Whether mappings changed since they were last saved
+        self._dirty = False
         
     def add_state_update_callback(
         self, callback: Callable[[StateUpdate], None]
@@ -118,24 +168,29 @@ class StateListenerManager:
         Args:
             callback: Callback function that receives StateUpdate objects
         """
-        self._state_update_callbacks.append(callback)
+        self._state_update_callbacks = (*self._state_update_callbacks, callback)
         
     def remove_state_update_callback(
         self, callback: Callable[[StateUpdate], None]
     ) -> None:
         """Remove a global state update callback."""
-        if callback in self._state_update_callbacks:
-            self._state_update_callbacks.remove(callback)
+        callbacks = self._state_update_callbacks
+        if callback in callbacks:
+            index = callbacks.index(callback)
+            self._state_update_callbacks = callbacks[:index] + callbacks[index + 1:]
     
     def _get_listener_key(
         self,
         device_id: str,
         property_type: StatePropertyType,
         index: Optional[int] = None,
-    ) -> str:
-        """Generate unique key for a listener."""
-        idx_str = f":{index}" if index is not None else ""
-        return f"{device_id}:{property_type.value}{idx_str}"
+    ) -> ListenerKey:
+        """Generate unique key for a listener.
+        
+        A tuple rather than a formatted string: cheaper to build, and the
+        enum value is used because str hashes in C while Enum.__hash__ doesn't.
+        """
+        return (device_id, property_type.value, index)
     
     async def async_add_listener(
         self,
@@ -161,6 +216,10 @@ class StateListenerManager:
         Returns:
             The created listener instance
         """
+        # The same IDs are repeated across listener keys, listeners and
+        # mappings; keep a single copy of each
+        device_id = sys.intern(device_id)
+        entity_id = sys.intern(entity_id)
         key = self._get_listener_key(device_id, property_type, index)
         
         # Remove existing listener if any
@@ -186,6 +245,7 @@ class StateListenerManager:
         
         # Store listener
         self._listeners[key] = listener
+        self._listeners_by_device.setdefault(device_id, {})[key] = listener
         
         # Store mapping
         mapping = ListenerMapping(
@@ -196,7 +256,8 @@ class StateListenerManager:
             index=index,
             attribute_name=attribute_name,
         )
-        self._mappings[key] = mapping
+        self._mappings[key] = mapping.to_dict()
+        self._dirty = True
         
         # Start listener if requested
         if auto_start:
@@ -227,8 +288,10 @@ class StateListenerManager:
         key = self._get_listener_key(device_id, property_type, index)
         
         if listener := self._listeners.pop(key, None):
+            self._unindex_listener(device_id, key)
             await listener.async_stop()
             self._mappings.pop(key, None)
+            self._dirty = True
             _LOGGER.info(
                 "Removed state listener: %s",
                 property_type.value,
@@ -240,13 +303,17 @@ class StateListenerManager:
         Args:
             device_id: Virtual device ID
         """
-        keys_to_remove = [k for k in self._listeners.keys() if k.startswith(f"{device_id}:")]
-        for key in keys_to_remove:
-            listener = self._listeners.pop(key)
-            await listener.async_stop()
+        device_listeners = self._listeners_by_device.pop(device_id, {})
+        for key in device_listeners:
+            self._listeners.pop(key, None)
             self._mappings.pop(key, None)
+        await self._async_run_listeners(list(device_listeners.values()), "async_stop")
+        
+        _LOGGER.info("Removed %d listeners for device %s", len(device_listeners), device_id)
         
-        _LOGGER.info("Removed %d listeners for device %s", len(keys_to_remove), device_id)
+        if device_listeners:
+            self._dirty = True
+            self.async_schedule_save()
     
     def get_listener(
         self,
@@ -276,18 +343,26 @@ class StateListenerManager:
         Returns:
             List of listeners for the device
         """
-        return [
-            listener
-            for key, listener in self._listeners.items()
-            if key.startswith(f"{device_id}:")
-        ]
+        return list(self._listeners_by_device.get(device_id, {}).values())
+    
+    def _unindex_listener(self, device_id: str, key: ListenerKey) -> None:
+        """Remove a listener from the per-device index."""
+        device_listeners = self._listeners_by_device.get(device_id)
+        if device_listeners is not None:
+            device_listeners.pop(key, None)
+            if not device_listeners:
+                del self._listeners_by_device[device_id]
     
     def _handle_state_update(self, update: StateUpdate) -> None:
         """Handle state update from a listener."""
         _LOGGER.debug("State update: %s", update)
         
+        callbacks = self._state_update_callbacks
+        if not callbacks:
+            return
+        
         # Notify all global callbacks
-        for callback in self._state_update_callbacks:
+        for callback in callbacks:
             try:
                 callback(update)
             except Exception as err:
@@ -297,32 +372,103 @@ class StateListenerManager:
                     exc_info=True,
                 )
     
+    def _mapping_source(self) -> Path:
+        """Return the file to load mappings from.
+        
+        A JSON mapping file that doesn't exist yet falls back to a YAML file
+        with the same name, so mappings saved by older versions are picked up
+        and migrated to JSON on the next save.
+        """
+        if self.mapping_file.suffix == ".json" and not self.mapping_file.exists():
+            legacy_file = self.mapping_file.with_suffix(".yaml")
+            if legacy_file.exists():
+                return legacy_file
+        return self.mapping_file
+    
+    def _read_mapping_file(self) -> dict[str, Any]:
+        """Read and parse the mapping file in the format given by its suffix."""
+        source = self._mapping_source()
+        if source.suffix == ".json":
+            raw = source.read_bytes()
+            if not raw.strip():
+                return {}
+            return (orjson.loads(raw) if orjson is not None else json.loads(raw)) or {}
+        
+        if source != self.mapping_file:
+            _LOGGER.info("Migrating listener mappings from %s to %s", source, self.mapping_file)
+        with open(source, "r", encoding="utf-8") as f:
+            return yaml.load(f, Loader=SafeLoader) or {}
+    
+    def _read_mappings(self) -> list[ListenerMapping]:
+        """Read the listener mappings from the mapping file.
+        
+        JSON mapping files are streamed record by record with ijson when it
+        is installed, so only the resulting ListenerMapping objects are held
+        in memory rather than the whole parsed document as well.
+        """
+        source = self._mapping_source()
+        if ijson is not None and source.suffix == ".json" and source.stat().st_size:
+            with open(source, "rb") as f:
+                return [
+                    ListenerMapping.from_dict(mapping_data)
+                    for mapping_data in ijson.items(f, "listener_mappings.item", use_float=True)
+                ]
+        
+        data = self._read_mapping_file()
+        return [
+            ListenerMapping.from_dict(mapping_data)
+            for mapping_data in data.get("listener_mappings", [])
+        ]
+    
+    def _write_mapping_file(self, data: dict[str, Any]) -> None:
+        """Serialize data to the mapping file in the format given by its suffix.
+        
+        The data is written to a temporary file next to the mapping file which
+        then atomically replaces it, so a failed write never leaves a
+        truncated mapping file behind.
+        """
+        # Ensure directory exists
+        self.mapping_file.parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = self.mapping_file.with_name(self.mapping_file.name + ".tmp")
+        try:
+            if self.mapping_file.suffix == ".json":
+                if orjson is not None:
+                    tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+                else:
+                    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            else:
+                payload = yaml.dump(data, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+                tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.mapping_file)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     async def async_load_mappings(self) -> None:
-        """Load listener mappings from YAML file."""
-        if not self.mapping_file or not self.mapping_file.exists():
+        """Load listener mappings from the mapping file."""
+        if not self.mapping_file or not self._mapping_source().exists():
             _LOGGER.debug("No mapping file found, starting with empty mappings")
             return
         
+        # Mappings read from a legacy YAML file still have to be written to
+        # the JSON mapping file; otherwise loading leaves nothing to save
+        was_dirty = self._dirty
+        migrating = self._mapping_source() != self.mapping_file
+        
         try:
-            # Load YAML file in executor to avoid blocking I/O
-            def _load_yaml():
-                with open(self.mapping_file, "r") as f:
-                    return yaml.safe_load(f) or {}
-            
-            data = await self.hass.async_add_executor_job(_load_yaml)
-            
-            mappings = data.get("listener_mappings", [])
+            # Load mapping file in executor to avoid blocking I/O
+            mappings = await self.hass.async_add_executor_job(self._read_mappings)
             _LOGGER.info("Loading %d listener mappings from %s", len(mappings), self.mapping_file)
             
-            for mapping_data in mappings:
-                mapping = ListenerMapping.from_dict(mapping_data)
-                
+            listener_classes = self.LISTENER_CLASSES
+            for mapping in mappings:
                 if not mapping.enabled:
                     _LOGGER.debug("Skipping disabled mapping for %s", mapping.entity_id)
                     continue
                 
                 # Get listener class
-                listener_class = self.LISTENER_CLASSES.get(mapping.listener_class)
+                listener_class = listener_classes.get(mapping.listener_class)
                 if not listener_class:
                     _LOGGER.warning(
                         "Unknown listener class: %s, skipping",
@@ -331,9 +477,8 @@ class StateListenerManager:
                     continue
                 
                 # Get property type
-                try:
-                    property_type = StatePropertyType(mapping.property_type)
-                except ValueError:
+                property_type = _STATE_PROPERTY_TYPES.get(mapping.property_type)
+                if property_type is None:
                     _LOGGER.warning(
                         "Unknown property type: %s, skipping",
                         mapping.property_type,
@@ -351,37 +496,61 @@ class StateListenerManager:
                     auto_start=True,
                 )
             
+            self._dirty = was_dirty or migrating
             _LOGGER.info("Loaded %d active listener mappings", len(self._listeners))
             
         except Exception as err:
             _LOGGER.error("Error loading listener mappings: %s", err, exc_info=True)
     
+    @callback
+    def async_schedule_save(self, delay: float = SAVE_DELAY) -> None:
+        """Schedule saving the listener mappings.
+        
+        Calls made while a save is already pending are coalesced into that
+        save, so bulk changes write the mapping file once.
+        
+        Args:
+            delay: Seconds to wait before saving
+        """
+        if not self.mapping_file or self._cancel_scheduled_save is not None:
+            return
+        self._cancel_scheduled_save = async_call_later(
+            self.hass, delay, self._async_scheduled_save
+        )
+    
+    async def _async_scheduled_save(self, _now: Any) -> None:
+        """Run a save scheduled by async_schedule_save()."""
+        self._cancel_scheduled_save = None
+        await self.async_save_mappings()
+    
     async def async_save_mappings(self) -> None:
-        """Save listener mappings to YAML file."""
+        """Save listener mappings to the mapping file."""
+        # Saving now supersedes any pending scheduled save
+        if self._cancel_scheduled_save is not None:
+            self._cancel_scheduled_save()
+            self._cancel_scheduled_save = None
+        
         if not self.mapping_file:
             _LOGGER.warning("No mapping file configured, cannot save")
             return
         
+        if not self._dirty:
+            _LOGGER.debug("Listener mappings unchanged, skipping save")
+            return
+        
         try:
-            # Convert mappings to list
-            mappings_list = [
-                mapping.to_dict()
-                for mapping in self._mappings.values()
-            ]
+            mappings_list = list(self._mappings.values())
             
             data = {
                 "listener_mappings": mappings_list,
             }
             
-            # Save YAML file in executor to avoid blocking I/O
-            def _save_yaml():
-                # Ensure directory exists
-                self.mapping_file.parent.mkdir(parents=True, exist_ok=True)
-                
-                with open(self.mapping_file, "w") as f:
-                    yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            # Cleared before writing, so changes made while the file is being
+            # written mark the mappings dirty again
+            self._dirty = False
             
-            await self.hass.async_add_executor_job(_save_yaml)
+            # Save mapping file in executor to avoid blocking I/O
+            await self.hass.async_add_executor_job(self._write_mapping_file, data)
             
             _LOGGER.info(
                 "Saved %d listener mappings to %s",
@@ -390,18 +559,41 @@ class StateListenerManager:
             )
             
         except Exception as err:
+            self._dirty = True
             _LOGGER.error("Error saving listener mappings: %s", err, exc_info=True)
     
+    async def _async_run_listeners(self, listeners: list[StateListener], method: str) -> None:
+        """Run a listener method (e.g. "async_start") on listeners concurrently.
+        
+        A failing listener is logged and doesn't keep the others from running.
+        
+        Args:
+            listeners: Listeners to run the method on
+            method: Name of the coroutine method to call
+        """
+        results = await asyncio.gather(
+            *[getattr(listener, method)() for listener in listeners],
+            return_exceptions=True,
+        )
+        for listener, result in zip(listeners, results):
+            if isinstance(result, BaseException):
+                _LOGGER.error(
+                    "Error in %s for %s -> %s: %s",
+                    method,
+                    listener.entity_id,
+                    listener.property_type.value,
+                    result,
+                    exc_info=result,
+                )
+    
     async def async_start_all(self) -> None:
         """Start all listeners."""
-        for listener in self._listeners.values():
-            await listener.async_start()
+        await self._async_run_listeners(list(self._listeners.values()), "async_start")
         _LOGGER.info("Started %d state listeners", len(self._listeners))
     
     async def async_stop_all(self) -> None:
         """Stop all listeners."""
-        for listener in self._listeners.values():
-            await listener.async_stop()
+        await self._async_run_listeners(list(self._listeners.values()), "async_stop")
         _LOGGER.info("Stopped %d state listeners", len(self._listeners))
     
     def get_statistics(self) -> dict[str, Any]:
@@ -410,24 +602,14 @@ class StateListenerManager:
         Returns:
             Dictionary with listener statistics
         """
-        stats = {
+        listeners = self._listeners.values()
+        return {
             "total_listeners": len(self._listeners),
             "total_mappings": len(self._mappings),
-            "listeners_by_type": {},
-            "listeners_by_device": {},
+            "listeners_by_type": dict(
+                Counter(listener.property_type.value for listener in listeners)
+            ),
+            "listeners_by_device": dict(
+                Counter(listener.device_id for listener in listeners)
+            ),
         }
-        
-        for key, listener in self._listeners.items():
-            # Count by type
-            prop_type = listener.property_type.value
-            stats["listeners_by_type"][prop_type] = (
-                stats["listeners_by_type"].get(prop_type, 0) + 1
-            )
-            
-            # Count by device
-            device_id = listener.device_id
-            stats["listeners_by_device"][device_id] = (
-                stats["listeners_by_device"].get(device_id, 0) + 1
-            )
-        
-        return stats
@@ -7,6 +7,7 @@ virtual devices, property elements, property trees, and DSUID generation.
 from .device_classes import (
     ADDITIONAL_COLOR_GROUPS,
     DEVICE_CLASSES,
+    DEVICE_CLASSES_BY_GID,
     DSColor,
     DSGroupID,
     DSPrimaryChannel,
@@ -32,10 +33,12 @@ from .device_converter import (
     create_vdsd_property_element_tree,
     extract_property_subtree,
     merge_property_updates,
+    merge_property_updates_batch,
 )
 
 __all__ = [
     "DEVICE_CLASSES",
+    "DEVICE_CLASSES_BY_GID",
     "ADDITIONAL_COLOR_GROUPS",
     "DSColor",
     "DSGroupID",
@@ -64,4 +67,5 @@ __all__ = [
     "create_vdsd_property_element_tree",
     "extract_property_subtree",
     "merge_property_updates",
+    "merge_property_updates_batch",
 ]
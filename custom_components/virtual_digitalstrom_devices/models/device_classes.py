@@ -9,6 +9,7 @@ aggregated into color groups for easy identification and control.
 """
 
 from enum import Enum
+from operator import attrgetter
 from typing import NamedTuple
 
 
@@ -188,6 +189,18 @@ DEVICE_CLASSES = {
 }
 
 
+# Device classes pre-sorted by group ID (DEVICE_CLASSES is static, so sort once)
+DEVICE_CLASSES_BY_GID: tuple[DeviceClass, ...] = tuple(
+    sorted(DEVICE_CLASSES.values(), key=attrgetter("group_id"))
+)
+
+# Device classes per color, each pre-sorted by group ID
+_DEVICE_CLASSES_BY_COLOR: dict[DSColor, tuple[DeviceClass, ...]] = {
+    color: tuple(dc for dc in DEVICE_CLASSES_BY_GID if dc.color == color)
+    for color in DSColor
+}
+
+
 # Additional color groups defined in the specification but not mapped to specific group IDs
 ADDITIONAL_COLOR_GROUPS = {
     DSColor.RED: {
@@ -236,9 +249,9 @@ def get_device_classes_by_color(color: DSColor) -> list[DeviceClass]:
         color: The digitalSTROM color
         
     Returns:
-        List of device classes matching the color
+        List of device classes matching the color, sorted by group ID
     """
-    return [dc for dc in DEVICE_CLASSES.values() if dc.color == color]
+    return list(_DEVICE_CLASSES_BY_COLOR.get(color, ()))
 
 
 def get_all_device_classes() -> list[DeviceClass]:
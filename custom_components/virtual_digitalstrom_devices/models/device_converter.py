@@ -6,19 +6,54 @@ PropertyElement trees suitable for vDC API communication.
 
 from __future__ import annotations
 
+import copy
 from typing import Any, Dict, List, Optional
 
 try:
     from .virtual_device import VirtualDevice
-    from .property_element import PropertyElement, PropertyValue, build_property_tree_from_dict
+    from .property_element import (
+        LazyBranchElement,
+        PropertyElement,
+        PropertyValue,
+        build_property_tree_from_dict,
+    )
     from .property_tree import DeviceConfigurations
 except ImportError:
     # Fallback for standalone usage
     from virtual_device import VirtualDevice  # type: ignore
-    from property_element import PropertyElement, PropertyValue, build_property_tree_from_dict  # type: ignore
+    from property_element import (  # type: ignore
+        LazyBranchElement,
+        PropertyElement,
+        PropertyValue,
+        build_property_tree_from_dict,
+    )
     from property_tree import DeviceConfigurations  # type: ignore
 
 
+# (VirtualDevice attribute, property name) of the common properties
+# (Chapter 2) that are always emitted
+_COMMON_PROPERTIES = (
+    ("dsid", "dSUID"),
+    ("display_id", "displayId"),
+    ("type", "type"),
+    ("model", "model"),
+    ("model_version", "modelVersion"),
+    ("model_uid", "modelUID"),
+)
+
+# Optional common properties, emitted only when set
+_OPTIONAL_COMMON_PROPERTIES = (
+    ("hardware_version", "hardwareVersion"),
+    ("hardware_guid", "hardwareGuid"),
+    ("hardware_model_guid", "hardwareModelGuid"),
+    ("vendor_name", "vendorName"),
+    ("vendor_guid", "vendorGuid"),
+    ("oem_guid", "oemGuid"),
+    ("oem_model_guid", "oemModelGuid"),
+    ("device_class", "deviceClass"),
+    ("device_class_version", "deviceClassVersion"),
+)
+
 def virtual_device_to_property_element(device: VirtualDevice, name: str = "device") -> PropertyElement:
     """Convert a VirtualDevice to a complete PropertyElement tree.
     
@@ -32,36 +67,15 @@ def virtual_device_to_property_element(device: VirtualDevice, name: str = "devic
     Returns:
         PropertyElement tree representing the complete device
     """
-    # Build dictionary representation
-    device_dict = {}
-    
-    # Common properties (Chapter 2)
-    device_dict["dSUID"] = device.dsid
-    device_dict["displayId"] = device.display_id
-    device_dict["type"] = device.type
-    device_dict["model"] = device.model
-    device_dict["modelVersion"] = device.model_version
-    device_dict["modelUID"] = device.model_uid
+    # Build dictionary representation, starting with the common
+    # properties (Chapter 2)
+    device_dict = {key: getattr(device, attr) for attr, key in _COMMON_PROPERTIES}
     
     # Optional common properties
-    if device.hardware_version:
-        device_dict["hardwareVersion"] = device.hardware_version
-    if device.hardware_guid:
-        device_dict["hardwareGuid"] = device.hardware_guid
-    if device.hardware_model_guid:
-        device_dict["hardwareModelGuid"] = device.hardware_model_guid
-    if device.vendor_name:
-        device_dict["vendorName"] = device.vendor_name
-    if device.vendor_guid:
-        device_dict["vendorGuid"] = device.vendor_guid
-    if device.oem_guid:
-        device_dict["oemGuid"] = device.oem_guid
-    if device.oem_model_guid:
-        device_dict["oemModelGuid"] = device.oem_model_guid
-    if device.device_class:
-        device_dict["deviceClass"] = device.device_class
-    if device.device_class_version:
-        device_dict["deviceClassVersion"] = device.device_class_version
+    for attr, key in _OPTIONAL_COMMON_PROPERTIES:
+        value = getattr(device, attr)
+        if value:
+            device_dict[key] = value
     if device.active is not None:
         device_dict["active"] = device.active
     if device.name:
@@ -71,21 +85,49 @@ def virtual_device_to_property_element(device: VirtualDevice, name: str = "devic
     device_dict["primaryGroup"] = device.group_id
     device_dict["zoneID"] = device.zone_id
     
-    # Model features
-    device_dict["modelFeatures"] = device.attributes.get("modelFeatures", {})
+    # Model features (nested features are built lazily, see below)
+    model_features = device.attributes.get("modelFeatures", {})
+    if not isinstance(model_features, (dict, list)):
+        device_dict["modelFeatures"] = model_features
     
-    # Configurations as property tree
-    if device.configurations and isinstance(device.configurations, DeviceConfigurations):
-        device_dict["configurations"] = device.configurations.to_property_elements()
-    elif device.configurations and isinstance(device.configurations, list):
+    # Build PropertyElement tree from dictionary
+    tree = build_property_tree_from_dict(device_dict, name)
+    
+    # Model features and configurations are only built when a request
+    # actually reads them. Their data is captured now, so the tree shows
+    # the device as it was at this call even if it is edited before the
+    # first read.
+    if isinstance(model_features, (dict, list)):
+        tree.elements.append(_lazy_branch("modelFeatures", copy.deepcopy(model_features)))
+    
+    configurations = device.configurations
+    if configurations and isinstance(configurations, DeviceConfigurations):
+        tree.elements.append(
+            _lazy_branch("configurations", configurations.to_property_elements())
+        )
+    elif configurations and isinstance(configurations, list):
         # Legacy format - convert to simple structure
-        device_dict["configurations"] = {
-            config_id: {"id": config_id}
-            for config_id in device.configurations
-        }
+        tree.elements.append(_lazy_branch(
+            "configurations",
+            {config_id: {"id": config_id} for config_id in configurations},
+        ))
     
-    # Build PropertyElement tree from dictionary
-    return build_property_tree_from_dict(device_dict, name)
+    return tree
+
+
+def _lazy_branch(name: str, data: Any) -> LazyBranchElement:
+    """Create a branch whose children are built from data on first access.
+    
+    Args:
+        name: Branch name
+        data: Nested dict/list for the branch, not shared with the device
+        
+    Returns:
+        LazyBranchElement for the branch
+    """
+    return LazyBranchElement(
+        name, lambda: build_property_tree_from_dict(data, name).elements
+    )
 
 
 def property_element_to_virtual_device(element: PropertyElement) -> VirtualDevice:
@@ -189,17 +231,8 @@ def extract_property_subtree(
     current = root
     
     for name in path:
-        if not current.elements:
-            return None
-        
-        found = False
-        for elem in current.elements:
-            if elem.name == name:
-                current = elem
-                found = True
-                break
-        
-        if not found:
+        current = current.get_element(name)
+        if current is None:
             return None
     
     return current
@@ -214,6 +247,11 @@ def merge_property_updates(
     This is used for vDC API SetProperty requests to update specific
     properties while preserving the rest of the tree.
     
+    Branches present in both trees are merged by child name; any other
+    update replaces the target element of the same name. The target is not
+    modified: only the elements along updated paths are copied, all other
+    subtrees are shared with the target.
+    
     Args:
         target: Target PropertyElement tree
         updates: PropertyElement with updates to apply
@@ -221,6 +259,88 @@ def merge_property_updates(
     Returns:
         Updated PropertyElement tree
     """
-    # For now, simple implementation
-    # TODO: Implement proper recursive merge
-    return updates
+    return merge_property_updates_batch(target, [updates])
+
+
+def merge_property_updates_batch(
+    target: PropertyElement,
+    updates: List[PropertyElement]
+) -> PropertyElement:
+    """Merge several property updates into a target tree in a single pass.
+    
+    The result equals applying merge_property_updates() for each update in
+    order, but the target tree is walked only once and branches along paths
+    shared by several updates are copied only once.
+    
+    Args:
+        target: Target PropertyElement tree
+        updates: PropertyElements with updates to apply, in order
+        
+    Returns:
+        Updated PropertyElement tree
+    """
+    return _apply_updates(target, updates)
+
+
+def _apply_updates(
+    current: Optional[PropertyElement],
+    updates: List[PropertyElement]
+) -> PropertyElement:
+    """Apply same-named updates, in order, to an element.
+    
+    Args:
+        current: Existing element, or None if there is none yet
+        updates: Non-empty list of updates for that element
+        
+    Returns:
+        Resulting element
+    """
+    # An update with a value replaces the element and everything before it
+    for idx in range(len(updates) - 1, -1, -1):
+        if updates[idx].value is not None:
+            current = updates[idx]
+            updates = updates[idx + 1:]
+            break
+    
+    if not updates:
+        return current
+    
+    # Branch updates replace a missing or leaf element
+    if current is None or current.value is not None:
+        current = updates[0]
+        updates = updates[1:]
+        if not updates:
+            return current
+    
+    return _merge_branch(current, updates)
+
+
+def _merge_branch(target: PropertyElement, updates: List[PropertyElement]) -> PropertyElement:
+    """Merge the children of the `updates` branches into a copy of `target`.
+    
+    Args:
+        target: Target branch element
+        updates: Branch elements with updates to apply, in order
+        
+    Returns:
+        New branch element named like the target
+    """
+    elements = list(target.elements)
+    positions: Dict[str, int] = {}
+    for idx, element in enumerate(elements):
+        positions.setdefault(element.name, idx)
+    
+    # Updates for each child name, in order
+    updates_by_name: Dict[str, List[PropertyElement]] = {}
+    for branch in updates:
+        for update in branch.elements:
+            updates_by_name.setdefault(update.name, []).append(update)
+    
+    for name, child_updates in updates_by_name.items():
+        idx = positions.get(name)
+        if idx is None:
+            elements.append(_apply_updates(None, child_updates))
+        else:
+            elements[idx] = _apply_updates(elements[idx], child_updates)
+    
+    return PropertyElement(name=target.name, elements=elements)
@@ -41,6 +41,10 @@ NAMESPACE_MAC = uuid.uuid5(NAMESPACE_DNS, "macaddress")
 # EnOcean namespace
 NAMESPACE_ENOCEAN = uuid.uuid5(NAMESPACE_DNS, "enocean.com")
 
+# Translation tables stripping address separators in a single pass
+_MAC_SEPARATORS = str.maketrans("", "", ":-.")
+_ENOCEAN_SEPARATORS = str.maketrans("", "", " ")
+
 
 # =============================================================================
 # Helper Classes
@@ -174,7 +178,7 @@ def generate_dsuid_from_mac(mac_address: str) -> str:
         34-character hex string (17 bytes)
     """
     # Normalize MAC address (remove separators)
-    mac_clean = mac_address.replace(':', '').replace('-', '').replace('.', '').upper()
+    mac_clean = mac_address.translate(_MAC_SEPARATORS).upper()
     
     if len(mac_clean) != 12:
         raise ValueError(f"Invalid MAC address: {mac_address}")
@@ -201,7 +205,7 @@ def generate_dsuid_from_enocean(enocean_address: str) -> str:
         34-character hex string (17 bytes)
     """
     # Normalize EnOcean address
-    enocean_clean = enocean_address.replace(' ', '').upper()
+    enocean_clean = enocean_address.translate(_ENOCEAN_SEPARATORS).upper()
     
     if len(enocean_clean) != 8:
         raise ValueError(f"Invalid EnOcean address: {enocean_address}")
@@ -26,10 +26,17 @@ A PropertyElement either contains:
 
 from __future__ import annotations
 
+import json
+import sys
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore
+
 
 # =============================================================================
 # Property Value Types
@@ -38,7 +45,7 @@ from enum import Enum
 PropertyValueType = Union[bool, int, float, str, bytes, None]
 
 
-@dataclass
+@dataclass(slots=True)
 class PropertyValue:
     """Property value matching protobuf PropertyValue message.
     
@@ -61,6 +68,14 @@ class PropertyValue:
         Returns:
             PropertyValue instance
         """
+        # Exact built-in types: one table lookup instead of the isinstance
+        # chain (which must test bool before int)
+        if cls is PropertyValue:
+            ctor = _VALUE_CONSTRUCTORS.get(type(value))
+            if ctor is not None:
+                return ctor(value)
+        
+        # None and subclasses (e.g. int enums)
         if value is None:
             return cls()
         elif isinstance(value, bool):
@@ -123,8 +138,54 @@ class PropertyValue:
 # Property Element
 # =============================================================================
 
-@dataclass
-class PropertyElement:
+# PropertyValue constructor for each exact built-in value type, used by
+# PropertyValue.from_python
+_VALUE_CONSTRUCTORS: Dict[type, Callable[[Any], PropertyValue]] = {
+    bool: lambda value: PropertyValue(v_bool=value),
+    int: lambda value: PropertyValue(v_uint64=value) if value >= 0 else PropertyValue(v_int64=value),
+    float: lambda value: PropertyValue(v_double=value),
+    str: lambda value: PropertyValue(v_string=value),
+    bytes: lambda value: PropertyValue(v_bytes=value),
+}
+
+
+class _EmptyElements(list):
+    """Immutable empty child list shared by all leaf elements.
+    
+    Saves allocating an empty list per leaf while still comparing equal to
+    (and behaving like) an empty list for readers.
+    """
+    
+    __slots__ = ()
+    
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Leaf elements have no children; use add_element() on a branch")
+    
+    append = extend = insert = remove = pop = clear = sort = reverse = _immutable
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    
+    def __copy__(self) -> _EmptyElements:
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> _EmptyElements:
+        return self
+
+
+# Shared children list of leaf elements
+_NO_ELEMENTS: List[Any] = _EmptyElements()
+
+
+class _NameIndexSlot:
+    """Holds PropertyElement's child name index outside the dataclass fields.
+    
+    Keeps the cache out of __init__, repr, comparison and asdict().
+    """
+    
+    __slots__ = ("_name_index", "_indexed_elements")
+
+
+@dataclass(slots=True)
+class PropertyElement(_NameIndexSlot):
     """Property element matching protobuf PropertyElement message.
     
     This is the core structure for vDC API communication. A PropertyElement
@@ -152,11 +213,29 @@ class PropertyElement:
                 )
             ]
         )
+    
+    Leaves created by create_leaf(), from_dict() and
+    build_property_tree_from_dict() share one immutable empty ``elements``
+    list: mutating it (``leaf.elements.append(...)``) raises TypeError. Add
+    children with add_element(), which replaces the shared list with a new
+    one (after the value has been cleared), or assign a new list.
     """
     name: str
     value: Optional[PropertyValue] = None
+    # Leaves from the factory methods share the immutable _NO_ELEMENTS list
     elements: List[PropertyElement] = field(default_factory=list)
     
+    def __post_init__(self) -> None:
+        """Intern the name, which comes from a small vocabulary shared by all trees."""
+        if type(self.name) is str:
+            self.name = sys.intern(self.name)
+        # Child name -> position of the first child with that name, built on
+        # the first lookup, and a copy of the children it was built from.
+        # A hit rebuilds the index when `elements` no longer matches the copy
+        # (replace, pop, append or a new list); a miss falls back to a scan.
+        self._name_index: Optional[Dict[str, int]] = None
+        self._indexed_elements: Optional[List[PropertyElement]] = None
+    
     def is_leaf(self) -> bool:
         """Check if this is a leaf node (has value, no children)."""
         return self.value is not None and len(self.elements) == 0
@@ -166,10 +245,19 @@ class PropertyElement:
         return len(self.elements) > 0 and self.value is None
     
     def add_element(self, element: PropertyElement) -> None:
-        """Add a child element to this branch node."""
+        """Add a child element to this branch node.
+        
+        Works on every branch, including elements that still hold the
+        shared immutable children list of a (former) leaf.
+        """
         if self.value is not None:
             raise ValueError("Cannot add elements to a leaf node with a value")
+        if type(self.elements) is _EmptyElements:
+            self.elements = []
         self.elements.append(element)
+        if self._name_index is not None:
+            self._indexed_elements.append(element)
+            self._name_index.setdefault(element.name, len(self.elements) - 1)
     
     def get_element(self, name: str) -> Optional[PropertyElement]:
         """Get a child element by name.
@@ -180,10 +268,47 @@ class PropertyElement:
         Returns:
             PropertyElement if found, None otherwise
         """
-        for element in self.elements:
-            if element.name == name:
-                return element
-        return None
+        elements = self.elements
+        name_index = self._name_index
+        if name_index is None:
+            name_index = self._index_elements(elements)
+        
+        position = name_index.get(name)
+        if position is None:
+            # Not indexed: plain scan, in case the list was edited or a
+            # child renamed since the index was built
+            for element in elements:
+                if element.name == name:
+                    return element
+            return None
+        
+        if self._indexed_elements != elements:
+            # Direct edit of the list: rebuild
+            position = self._index_elements(elements).get(name)
+            return elements[position] if position is not None else None
+        
+        element = elements[position]
+        if element.name == name:
+            return element
+        # The child was renamed in place: rebuild
+        position = self._index_elements(elements).get(name)
+        return elements[position] if position is not None else None
+    
+    def _index_elements(self, elements: List[PropertyElement]) -> Dict[str, int]:
+        """Rebuild the child name index from elements.
+        
+        Args:
+            elements: Current children
+            
+        Returns:
+            Child name -> position of the first child with that name
+        """
+        name_index: Dict[str, int] = {}
+        for position, element in enumerate(elements):
+            name_index.setdefault(element.name, position)
+        self._name_index = name_index
+        self._indexed_elements = list(elements)
+        return name_index
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization.
@@ -209,7 +334,8 @@ class PropertyElement:
             data: Dictionary with name, value, and/or elements
             
         Returns:
-            PropertyElement instance
+            PropertyElement instance (leaves share the immutable empty
+            ``elements`` list)
         """
         name = data.get("name", "")
         
@@ -226,13 +352,41 @@ class PropertyElement:
                 v_bytes=bytes.fromhex(value_data["v_bytes"]) if "v_bytes" in value_data else None,
             )
         
-        # Parse elements if present
-        elements = []
+        # Parse elements if present (leaves share one empty list)
         if "elements" in data:
             elements = [cls.from_dict(elem) for elem in data["elements"]]
+        elif value is not None:
+            elements = _NO_ELEMENTS
+        else:
+            elements = []
         
         return cls(name=name, value=value, elements=elements)
     
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON in the to_dict() format.
+        
+        Uses orjson when installed, falling back to the standard json module.
+        
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        data = self.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data)
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+    
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> PropertyElement:
+        """Create PropertyElement from JSON produced by to_json_bytes().
+        
+        Args:
+            data: JSON document (bytes or str)
+            
+        Returns:
+            PropertyElement instance
+        """
+        return cls.from_dict(orjson.loads(data) if orjson is not None else json.loads(data))
+    
     @classmethod
     def create_leaf(cls, name: str, value: PropertyValueType) -> PropertyElement:
         """Create a leaf node with a simple value.
@@ -242,9 +396,10 @@ class PropertyElement:
             value: Python value (bool, int, float, str, bytes)
             
         Returns:
-            PropertyElement leaf node
+            PropertyElement leaf node (its ``elements`` is the shared
+            immutable empty list)
         """
-        return cls(name=name, value=PropertyValue.from_python(value))
+        return cls(name=name, value=PropertyValue.from_python(value), elements=_NO_ELEMENTS)
     
     @classmethod
     def create_branch(cls, name: str, children: List[PropertyElement]) -> PropertyElement:
@@ -260,6 +415,51 @@ class PropertyElement:
         return cls(name=name, elements=children)
 
 
+# Slot descriptor holding PropertyElement.elements, used by LazyBranchElement
+_ELEMENTS_SLOT = PropertyElement.__dict__["elements"]
+
+
+class LazyBranchElement(PropertyElement):
+    """Branch node whose children are built on first access.
+    
+    Used for subtrees that are expensive to build and often not requested,
+    such as device configurations. Reading ``elements`` (directly or through
+    get_element, to_dict, etc.) runs the builder once and keeps its result.
+    """
+    
+    __slots__ = ("_builder",)
+    
+    def __init__(self, name: str, builder: Callable[[], List[PropertyElement]]) -> None:
+        """Initialize the lazy branch.
+        
+        Args:
+            name: Property name
+            builder: Callable returning the child PropertyElements
+        """
+        super().__init__(name=name)
+        self._builder = builder
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare equal to an eager PropertyElement with the same content."""
+        if not isinstance(other, PropertyElement):
+            return NotImplemented
+        return (self.name, self.value, self.elements) == (other.name, other.value, other.elements)
+    
+    @property
+    def elements(self) -> List[PropertyElement]:
+        """Child elements, built on first access."""
+        builder = self._builder
+        if builder is not None:
+            self._builder = None
+            _ELEMENTS_SLOT.__set__(self, builder())
+        return _ELEMENTS_SLOT.__get__(self, LazyBranchElement)
+    
+    @elements.setter
+    def elements(self, elements: List[PropertyElement]) -> None:
+        self._builder = None
+        _ELEMENTS_SLOT.__set__(self, elements)
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
@@ -275,7 +475,8 @@ def build_property_tree_from_dict(data: Dict[str, Any], name: str = "root") -> P
         name: Name for the root element
         
     Returns:
-        PropertyElement tree
+        PropertyElement tree (leaves share the immutable empty ``elements``
+        list)
     
     Example:
         data = {
@@ -291,62 +492,60 @@ def build_property_tree_from_dict(data: Dict[str, Any], name: str = "root") -> P
         }
         tree = build_property_tree_from_dict(data, "device")
     """
-    elements = []
-    
-    for key, value in data.items():
-        if isinstance(value, dict):
-            # Nested dictionary - create branch node
-            child_elements = []
-            for sub_key, sub_value in value.items():
-                if isinstance(sub_value, dict):
-                    # Recursively build nested structure
-                    child_elements.append(build_property_tree_from_dict(sub_value, sub_key))
-                else:
-                    # Leaf node
-                    child_elements.append(PropertyElement.create_leaf(sub_key, sub_value))
-            elements.append(PropertyElement.create_branch(key, child_elements))
-        elif isinstance(value, list):
-            # List of values - create indexed branch node
-            list_elements = []
-            for idx, item in enumerate(value):
-                if isinstance(item, dict):
-                    list_elements.append(build_property_tree_from_dict(item, str(idx)))
-                else:
-                    list_elements.append(PropertyElement.create_leaf(str(idx), item))
-            elements.append(PropertyElement.create_branch(key, list_elements))
+    root = PropertyElement(name=name, elements=[])
+    from_python = PropertyValue.from_python
+    
+    # Walk the nested containers with an explicit stack; each entry is a
+    # container and the elements list of the branch built for it. Lists
+    # become branches with their indexes as names.
+    stack = [(data, root.elements)]
+    while stack:
+        container, elements = stack.pop()
+        if isinstance(container, dict):
+            items = container.items()
         else:
-            # Simple value - create leaf node
-            elements.append(PropertyElement.create_leaf(key, value))
+            items = [(str(idx), item) for idx, item in enumerate(container)]
+        for key, value in items:
+            if isinstance(value, (dict, list)):
+                branch = PropertyElement(name=key, elements=[])
+                elements.append(branch)
+                stack.append((value, branch.elements))
+            else:
+                elements.append(
+                    PropertyElement(name=key, value=from_python(value), elements=_NO_ELEMENTS)
+                )
     
-    return PropertyElement.create_branch(name, elements)
+    return root
 
 
 def property_tree_to_dict(element: PropertyElement) -> Dict[str, Any]:
     """Convert a PropertyElement tree back to a Python dictionary.
     
+    Branches become nested dictionaries keyed by child name. Lists given to
+    build_property_tree_from_dict() come back as dicts keyed "0", "1", ...
+    
     Args:
         element: Root PropertyElement
         
     Returns:
-        Python dictionary
+        Python dictionary (``{name: value}`` for a leaf root, otherwise the
+        root's children)
     """
-    if element.is_leaf():
-        return {element.name: element.value.to_python() if element.value else None}
+    if element.value is not None and not element.elements:
+        return {element.name: element.value.to_python()}
+    return {child.name: _element_to_python(child) for child in element.elements}
+
+
+def _element_to_python(element: PropertyElement) -> Any:
+    """Convert one element (leaf or branch) to its Python value.
     
-    result = {}
-    for child in element.elements:
-        if child.is_leaf():
-            result[child.name] = child.value.to_python() if child.value else None
-        else:
-            # Branch - recursively convert
-            child_dict = {}
-            for sub_child in child.elements:
-                if sub_child.is_leaf():
-                    child_dict[sub_child.name] = sub_child.value.to_python() if sub_child.value else None
-                else:
-                    # Nested branch
-                    nested = property_tree_to_dict(sub_child)
-                    child_dict.update(nested)
-            result[child.name] = child_dict
-    
-    return result
+    Args:
+        element: PropertyElement to convert
+        
+    Returns:
+        Leaf value, or dict of the converted children
+    """
+    children = element.elements
+    if not children:
+        return element.value.to_python() if element.value is not None else {}
+    return {child.name: _element_to_python(child) for child in children}
@@ -40,15 +40,33 @@ See docs/external/vdc_properties.py for complete property element definitions.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
 
+# Element names "0", "1", ... of indexed children, built once
+_INDEX_NAMES = tuple(str(idx) for idx in range(256))
+
+
+def _index_names(count: int) -> Tuple[str, ...]:
+    """Return element names covering `count` indexed children.
+    
+    Args:
+        count: Number of children
+        
+    Returns:
+        Tuple with at least `count` names
+    """
+    if count <= len(_INDEX_NAMES):
+        return _INDEX_NAMES
+    return tuple(map(str, range(count)))
+
+
 # =============================================================================
 # Section 4.1.2: Configuration Input Properties
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConfigurationInputDescriptions:
     """Input descriptions within a configuration (Section 4.1.2).
     
@@ -61,20 +79,19 @@ class ConfigurationInputDescriptions:
     
     def to_property_elements(self) -> Dict[str, Any]:
         """Convert to vDC property elements structure."""
-        elements = {}
-        
         # Add button input references
-        for idx, button_id in enumerate(self.button_input_ids):
-            elements[str(idx)] = {"buttonInputId": button_id}
-        
-        return elements
+        button_input_ids = self.button_input_ids
+        return {
+            name: {"buttonInputId": button_id}
+            for name, button_id in zip(_index_names(len(button_input_ids)), button_input_ids)
+        }
 
 
 # =============================================================================
 # Section 4.1.3: Configuration Output and Channel Properties
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConfigurationOutputChannels:
     """Output and channel configuration (Section 4.1.3).
     
@@ -90,10 +107,11 @@ class ConfigurationOutputChannels:
         if self.output_id is not None:
             elements["outputId"] = self.output_id
         
-        if self.channel_ids:
+        channel_ids = self.channel_ids
+        if channel_ids:
             elements["channels"] = {
-                str(idx): {"channelId": ch_id}
-                for idx, ch_id in enumerate(self.channel_ids)
+                name: {"channelId": ch_id}
+                for name, ch_id in zip(_index_names(len(channel_ids)), channel_ids)
             }
         
         return elements
@@ -103,7 +121,7 @@ class ConfigurationOutputChannels:
 # Section 4.1.4: Configuration Scene Properties  
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConfigurationScenes:
     """Scene configuration (Section 4.1.4).
     
@@ -125,7 +143,7 @@ class ConfigurationScenes:
 # Configuration Property Tree
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ConfigurationPropertyTree:
     """Complete property tree for a single configuration.
     
@@ -186,33 +204,28 @@ class ConfigurationPropertyTree:
         config_id = element.get("id", "")
         description = element.get("description", "")
         
-        # Parse inputs
-        inputs = ConfigurationInputDescriptions()
-        if "inputs" in element:
-            inputs_data = element["inputs"]
-            # Extract button input IDs
-            for key, value in inputs_data.items():
-                if "buttonInputId" in value:
-                    inputs.button_input_ids.append(value["buttonInputId"])
+        # Parse inputs (button input IDs)
+        inputs_data = element.get("inputs", {})
+        inputs = ConfigurationInputDescriptions(button_input_ids=[
+            value["buttonInputId"] for value in inputs_data.values() if "buttonInputId" in value
+        ])
         
         # Parse outputs
-        outputs = ConfigurationOutputChannels()
-        if "outputs" in element:
-            outputs_data = element["outputs"]
-            if "outputId" in outputs_data:
-                outputs.output_id = outputs_data["outputId"]
-            if "channels" in outputs_data:
-                for key, value in outputs_data["channels"].items():
-                    if "channelId" in value:
-                        outputs.channel_ids.append(value["channelId"])
+        outputs_data = element.get("outputs", {})
+        outputs = ConfigurationOutputChannels(
+            output_id=outputs_data.get("outputId"),
+            channel_ids=[
+                value["channelId"]
+                for value in outputs_data.get("channels", {}).values()
+                if "channelId" in value
+            ],
+        )
         
         # Parse scenes
-        scenes = ConfigurationScenes()
-        if "scenes" in element:
-            scenes_data = element["scenes"]
-            for key, value in scenes_data.items():
-                if "sceneId" in value:
-                    scenes.scene_ids.append(value["sceneId"])
+        scenes_data = element.get("scenes", {})
+        scenes = ConfigurationScenes(scene_ids=[
+            value["sceneId"] for value in scenes_data.values() if "sceneId" in value
+        ])
         
         return cls(
             config_id=config_id,
@@ -237,27 +250,83 @@ class DeviceConfigurations:
     configurations: List[ConfigurationPropertyTree] = field(default_factory=list)
     current_config_id: Optional[str] = None
     
+    def __post_init__(self) -> None:
+        """Set up the configuration ID index."""
+        # Configuration ID -> position of the first configuration with that
+        # ID, and a copy of the list it was built from. Plain attributes, so
+        # the index stays out of __init__, repr, comparison and asdict().
+        # A hit rebuilds the index when `configurations` no longer matches
+        # the copy; a miss falls back to a scan.
+        self._config_index: Optional[Dict[str, int]] = None
+        self._indexed_configurations: Optional[List[ConfigurationPropertyTree]] = None
+    
     def add_configuration(self, config: ConfigurationPropertyTree) -> None:
-        """Add a configuration to the device."""
+        """Add a configuration to the device (replacing one with the same ID)."""
+        position = self._config_position(config.config_id)
+        if position is not None:
+            self.configurations[position] = config
+            self._indexed_configurations[position] = config
+            return
+        
         self.configurations.append(config)
+        self._indexed_configurations.append(config)
+        self._config_index[config.config_id] = len(self.configurations) - 1
     
     def get_configuration(self, config_id: str) -> Optional[ConfigurationPropertyTree]:
         """Get a configuration by ID."""
-        for config in self.configurations:
+        position = self._config_position(config_id)
+        return self.configurations[position] if position is not None else None
+    
+    def _config_position(self, config_id: str) -> Optional[int]:
+        """Find the position of a configuration by ID.
+        
+        Args:
+            config_id: Configuration ID
+            
+        Returns:
+            Position in `configurations`, or None if not found
+        """
+        configurations = self.configurations
+        config_index = self._config_index
+        if config_index is None or self._indexed_configurations != configurations:
+            config_index = self._index_configurations()
+        
+        position = config_index.get(config_id)
+        if position is not None:
+            if configurations[position].config_id == config_id:
+                return position
+            # The configuration ID was changed in place: rebuild
+            return self._index_configurations().get(config_id)
+        
+        # Not indexed: scan, in case an ID was changed in place
+        for position, config in enumerate(configurations):
             if config.config_id == config_id:
-                return config
+                return position
         return None
     
+    def _index_configurations(self) -> Dict[str, int]:
+        """Rebuild the configuration ID index.
+        
+        Returns:
+            Configuration ID -> position of the first configuration with that ID
+        """
+        config_index: Dict[str, int] = {}
+        for position, config in enumerate(self.configurations):
+            config_index.setdefault(config.config_id, position)
+        self._config_index = config_index
+        self._indexed_configurations = list(self.configurations)
+        return config_index
+    
     def to_property_elements(self) -> Dict[str, Any]:
         """Convert to vDC property elements structure.
         
         Returns:
             Dictionary where keys are configuration IDs and values are property elements
         """
-        elements = {}
-        for config in self.configurations:
-            elements[config.config_id] = config.to_property_element()
-        return elements
+        return {
+            config.config_id: config.to_property_element()
+            for config in self.configurations
+        }
     
     def to_config_id_list(self) -> List[str]:
         """Get list of configuration IDs (for backward compatibility).
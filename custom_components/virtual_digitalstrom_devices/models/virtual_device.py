@@ -37,7 +37,7 @@ except ImportError:
     DeviceConfigurations = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VirtualDevice:
     """Represents a virtual digitalSTROM device instance.
     
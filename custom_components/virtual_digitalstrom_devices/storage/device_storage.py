@@ -1,17 +1,34 @@
 """Device storage module for persisting virtual devices to YAML.
 
 This module provides the DeviceStorage class which handles reading and writing
-virtual device configurations to a YAML file.
+virtual device configurations to a YAML file. Storage paths ending in ".json"
+are written as JSON instead (using orjson when available), which is much
+faster to serialize for large device sets.
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml-backed loader/dumper when available (several times faster)
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None  # type: ignore
+
 # Handle both package imports (when used as Home Assistant integration)
 # and standalone imports (for examples/testing)
 try:
@@ -22,6 +39,26 @@ except ImportError:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Number of journaled STATE updates after which the journal is folded back
+# into the storage file
+JOURNAL_COMPACT_THRESHOLD = 256
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values JSON does not support natively (e.g. enums)."""
+    if hasattr(obj, "value"):
+        return obj.value
+    if isinstance(obj, (set, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _journal_line(record: dict[str, Any]) -> bytes:
+    """Serialize one state journal record as a newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(record, default=_json_default, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(record, default=_json_default).encode("utf-8") + b"\n"
+
 
 class DeviceStorage:
     """Handles YAML-based storage for virtual devices.
@@ -34,10 +71,21 @@ class DeviceStorage:
         """Initialize the device storage.
         
         Args:
-            storage_path: Path to the YAML storage file
+            storage_path: Path to the storage file (YAML, or JSON for a ".json" suffix)
         """
         self.storage_path = storage_path
         self._devices: dict[str, VirtualDevice] = {}
+        # Secondary index: group ID -> {device_id: device}, plus the group each
+        # device is currently filed under so re-grouping can move it
+        self._by_group: dict[int, dict[str, VirtualDevice]] = {}
+        self._device_groups: dict[str, int] = {}
+        # Nesting depth of batch() blocks; writes are deferred while > 0
+        self._batch_depth = 0
+        self._dirty = False
+        # Append-only journal of STATE value updates; replayed on load and
+        # folded into the storage file by the next full save
+        self.journal_path = storage_path.with_name(storage_path.name + ".journal")
+        self._journal_entries = 0
         # Don't load in __init__ to avoid blocking I/O in async context
         # Call load() separately when needed
     
@@ -46,32 +94,73 @@ class DeviceStorage:
         self._load()
     
     def _load(self) -> None:
-        """Load devices from YAML file."""
+        """Load devices from the storage file."""
         try:
             if self.storage_path.exists():
                 _LOGGER.debug("Loading devices from %s", self.storage_path)
-                with open(self.storage_path, "r", encoding="utf-8") as file:
-                    data = yaml.safe_load(file) or {}
-                    devices_data = data.get("devices", [])
-                    
-                    self._devices = {}
-                    for device_data in devices_data:
-                        device = VirtualDevice.from_dict(device_data)
-                        self._devices[device.device_id] = device
-                    
-                    _LOGGER.info("Loaded %d device(s) from storage", len(self._devices))
+                data = self._read_file() or {}
+                devices_data = data.get("devices", [])
+                
+                self._clear()
+                for device_data in devices_data:
+                    device = VirtualDevice.from_dict(device_data)
+                    self._devices[device.device_id] = device
+                    self._index_device(device)
+                
+                self._replay_journal()
+                
+                _LOGGER.info("Loaded %d device(s) from storage", len(self._devices))
             else:
                 _LOGGER.debug("Storage file does not exist, starting with empty device list")
-                self._devices = {}
+                self._clear()
         except (yaml.YAMLError, ValueError, KeyError) as e:
             _LOGGER.error("Error parsing device data from %s: %s", self.storage_path, e)
-            self._devices = {}
+            self._clear()
         except (FileNotFoundError, PermissionError, OSError) as e:
             _LOGGER.error("Error accessing storage file %s: %s", self.storage_path, e)
-            self._devices = {}
+            self._clear()
+    
+    @contextmanager
+    def batch(self, flush: bool = True) -> Iterator[DeviceStorage]:
+        """Defer writes until the end of a block of mutations.
+        
+        All add/update/save/delete calls inside the block only modify the
+        in-memory devices; the YAML file is written once when the outermost
+        block exits (and only if something changed).
+        
+        Example:
+            with storage.batch():
+                storage.add_device(light)
+                storage.add_device(blind)
+                storage.update_device(light.device_id, name="Main Light")
+        
+        Args:
+            flush: Write pending changes when the block exits. Pass False to
+                call flush() yourself, e.g. from an executor job.
+        
+        Yields:
+            This storage instance
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if flush:
+                self.flush()
+    
+    def flush(self) -> None:
+        """Write changes deferred by batch() (no-op inside a batch)."""
+        if self._batch_depth == 0 and self._dirty:
+            self._save()
     
     def _save(self) -> None:
-        """Save devices to YAML file."""
+        """Save devices to the storage file (deferred while inside a batch)."""
+        if self._batch_depth:
+            self._dirty = True
+            return
+        
+        self._dirty = False
         try:
             # Ensure parent directory exists
             self.storage_path.parent.mkdir(parents=True, exist_ok=True)
@@ -81,15 +170,117 @@ class DeviceStorage:
                 "devices": [device.to_dict() for device in self._devices.values()]
             }
             
-            # Write to YAML file
-            with open(self.storage_path, "w", encoding="utf-8") as file:
-                yaml.safe_dump(data, file, default_flow_style=False, sort_keys=False)
+            self._write_file(data)
+            
+            # The storage file now contains every journaled value
+            self._journal_entries = 0
+            self.journal_path.unlink(missing_ok=True)
             
             _LOGGER.debug("Saved %d device(s) to %s", len(self._devices), self.storage_path)
-        except yaml.YAMLError as e:
-            _LOGGER.error("Error serializing device data to YAML: %s", e)
+        except (yaml.YAMLError, TypeError) as e:
+            _LOGGER.error("Error serializing device data: %s", e)
+            # Keep the changes pending so the next flush() retries
+            self._dirty = True
         except (FileNotFoundError, PermissionError, OSError) as e:
             _LOGGER.error("Error writing to storage file %s: %s", self.storage_path, e)
+            self._dirty = True
+    
+    def _replay_journal(self) -> None:
+        """Apply journaled STATE values on top of the loaded devices."""
+        try:
+            raw = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            _LOGGER.error("Error reading state journal %s: %s", self.journal_path, e)
+            return
+        
+        count = 0
+        invalid = False
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = orjson.loads(line) if orjson is not None else json.loads(line)
+                device = self._devices.get(record["d"])
+                if device is None:
+                    continue
+                device.attributes.setdefault("state_values", {})[record["k"]] = record["v"]
+                count += 1
+            except (ValueError, KeyError, TypeError):
+                # e.g. a torn last line from an interrupted append
+                _LOGGER.warning("Skipping invalid entry in state journal %s", self.journal_path)
+                invalid = True
+        
+        # Compact on the next append so new entries aren't written after a torn line
+        self._journal_entries = JOURNAL_COMPACT_THRESHOLD if invalid else count
+        if count:
+            _LOGGER.debug("Replayed %d state value(s) from %s", count, self.journal_path)
+    
+    def _clear(self) -> None:
+        """Drop all devices and the group index."""
+        self._devices = {}
+        self._by_group = {}
+        self._device_groups = {}
+    
+    def _index_device(self, device: VirtualDevice) -> None:
+        """File a device under its current group, moving it if the group changed."""
+        group_id = self._get_group_id_value(device.group_id)
+        old_group_id = self._device_groups.get(device.device_id)
+        if old_group_id is not None and old_group_id != group_id:
+            self._unindex_device(device.device_id)
+        self._by_group.setdefault(group_id, {})[device.device_id] = device
+        self._device_groups[device.device_id] = group_id
+    
+    def _unindex_device(self, device_id: str) -> None:
+        """Remove a device from the group index."""
+        group_id = self._device_groups.pop(device_id, None)
+        if group_id is None:
+            return
+        bucket = self._by_group.get(group_id)
+        if bucket is not None:
+            bucket.pop(device_id, None)
+            if not bucket:
+                del self._by_group[group_id]
+    
+    def _is_json(self) -> bool:
+        """Check whether the storage file uses the JSON format."""
+        return self.storage_path.suffix.lower() == ".json"
+    
+    def _read_file(self) -> Any:
+        """Read and parse the storage file in the format given by its suffix."""
+        if self._is_json():
+            raw = self.storage_path.read_bytes()
+            if not raw.strip():
+                return None
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        
+        with open(self.storage_path, "r", encoding="utf-8") as file:
+            return yaml.load(file, Loader=SafeLoader)
+    
+    def _write_file(self, data: dict[str, Any]) -> None:
+        """Serialize data to the storage file in the format given by its suffix.
+        
+        The data is written to a temporary file next to the storage file which
+        then atomically replaces it, so a failed write never leaves a
+        truncated storage file behind.
+        """
+        tmp_path = self.storage_path.with_name(self.storage_path.name + ".tmp")
+        try:
+            if self._is_json():
+                if orjson is not None:
+                    payload = orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+                else:
+                    payload = json.dumps(data, default=_json_default, indent=2).encode("utf-8")
+                tmp_path.write_bytes(payload)
+            else:
+                # Dump to a string first: one write instead of many small stream writes
+                payload = yaml.dump(data, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
+                tmp_path.write_text(payload, encoding="utf-8")
+            os.replace(tmp_path, self.storage_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
     
     def add_device(self, device: VirtualDevice) -> bool:
         """Add a new device to storage.
@@ -105,10 +296,69 @@ class DeviceStorage:
             return False
         
         self._devices[device.device_id] = device
+        self._index_device(device)
         self._save()
         _LOGGER.info("Added device: %s (id: %s)", device.name, device.device_id)
         return True
     
+    def add_devices(self, devices: Iterable[VirtualDevice]) -> int:
+        """Add several devices to storage with a single write.
+        
+        Devices whose device_id already exists are skipped.
+        
+        Args:
+            devices: VirtualDevice instances to add
+            
+        Returns:
+            Number of devices that were added
+        """
+        with self.batch():
+            return sum(1 for device in devices if self.add_device(device))
+    
+    def append_state_values(self, device_id: str, state_values: dict[str, Any]) -> bool:
+        """Persist STATE values of a device without rewriting the storage file.
+        
+        The values are applied to the device's "state_values" attribute and
+        appended to the journal, so each update writes a few bytes instead of
+        the whole device list. The journal is compacted into the storage file
+        every JOURNAL_COMPACT_THRESHOLD entries and by any full save.
+        
+        Args:
+            device_id: ID of the device
+            state_values: Mapping of state key to stored entry ({"value", "timestamp"})
+            
+        Returns:
+            True if the values were stored, False if device not found
+        """
+        device = self._devices.get(device_id)
+        if device is None:
+            _LOGGER.warning("Device with id %s not found", device_id)
+            return False
+        
+        device.attributes.setdefault("state_values", {}).update(state_values)
+        
+        # Inside a batch the deferred full save covers these values
+        if self._batch_depth:
+            self._dirty = True
+            return True
+        
+        try:
+            lines = b"".join(
+                _journal_line({"d": device_id, "k": key, "v": entry})
+                for key, entry in state_values.items()
+            )
+            with open(self.journal_path, "ab") as journal:
+                journal.write(lines)
+        except (TypeError, ValueError, OSError) as e:
+            _LOGGER.error("Error writing state journal %s: %s", self.journal_path, e)
+            self._save()
+            return True
+        
+        self._journal_entries += len(state_values)
+        if self._journal_entries >= JOURNAL_COMPACT_THRESHOLD:
+            self._save()
+        return True
+    
     def update_device(self, device_id: str, **kwargs: Any) -> bool:
         """Update an existing device.
         
@@ -123,7 +373,9 @@ class DeviceStorage:
             _LOGGER.warning("Device with id %s not found", device_id)
             return False
         
-        self._devices[device_id].update(**kwargs)
+        device = self._devices[device_id]
+        device.update(**kwargs)
+        self._index_device(device)
         self._save()
         _LOGGER.info("Updated device: %s", device_id)
         return True
@@ -147,6 +399,7 @@ class DeviceStorage:
         
         # Update the reference in storage (in case it's a different object)
         self._devices[device.device_id] = device
+        self._index_device(device)
         self._save()
         _LOGGER.debug("Saved device: %s", device.device_id)
         return True
@@ -165,6 +418,7 @@ class DeviceStorage:
             return False
         
         device = self._devices.pop(device_id)
+        self._unindex_device(device_id)
         self._save()
         _LOGGER.info("Deleted device: %s (id: %s)", device.name, device_id)
         return True
@@ -239,11 +493,8 @@ class DeviceStorage:
         Returns:
             List of VirtualDevice instances in the group
         """
-        group_id_value = self._get_group_id_value(group_id)
-        return [
-            device for device in self._devices.values() 
-            if self._get_group_id_value(device.group_id) == group_id_value
-        ]
+        bucket = self._by_group.get(self._get_group_id_value(group_id))
+        return list(bucket.values()) if bucket else []
     
     def device_exists(self, device_id: str) -> bool:
         """Check if a device exists.
@@ -15,8 +15,10 @@ Based on COMPLETE_PROPERTY_CLASSIFICATION.md:
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Optional
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.service import async_call_from_config
@@ -27,6 +29,39 @@ from ..models.virtual_device import VirtualDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# Transient STATE properties (button clicks, etc.) are NOT persisted by default
+_TRANSIENT_STATE_PROPERTIES = frozenset({
+    StatePropertyType.BUTTON_VALUE,
+    StatePropertyType.BUTTON_ACTION_ID,
+    StatePropertyType.BUTTON_ACTION_MODE,
+})
+
+# STATE property types by value, so CONFIG paths are told apart from STATE
+# properties without raising and catching ValueError on every update
+_STATE_PROPERTY_TYPES: dict[str, StatePropertyType] = {
+    property_type.value: property_type for property_type in StatePropertyType
+}
+
+
+@lru_cache(maxsize=512)
+def _entity_mapping_key(
+    property_type: StatePropertyType,
+    index: Optional[int],
+) -> str:
+    """Build the entity_mappings key for a STATE property.
+    
+    Examples: "sensor[0].value", "channel[2].value", "control.heatingLevel"
+    """
+    if index is None:
+        return property_type.value
+    
+    # Extract base property name (e.g., "sensor.value" -> "sensor", "value")
+    parts = property_type.value.split(".")
+    if len(parts) == 2:
+        base, prop = parts
+        return f"{base}[{index}].{prop}"
+    return f"{property_type.value}[{index}]"
+
 
 class PropertyUpdateError(Exception):
     """Base exception for property update errors."""
@@ -246,6 +281,18 @@ class StatePropertyUpdater:
             StatePropertyType.SENSOR_ERROR,
             StatePropertyType.BINARY_ERROR,
         }
+        
+        # (push_to_ha, persist) defaults per property type, precomputed from
+        # the sets above so each update needs a single dict lookup
+        self._behavior: dict[StatePropertyType, tuple[bool, bool]] = {
+            property_type: (
+                property_type not in self.read_only_input_properties,
+                property_type in self.critical_persistent_properties
+                or property_type in self.recommended_persistent_properties
+                or property_type not in _TRANSIENT_STATE_PROPERTIES,
+            )
+            for property_type in StatePropertyType
+        }
     
     async def update_state_property(
         self,
@@ -291,7 +338,7 @@ class StatePropertyUpdater:
             entity_mapping = self._get_entity_mapping(device, property_type, index)
             
             # Check if this is a read-only input property
-            is_read_only_input = property_type in self.read_only_input_properties
+            is_read_only_input = not self._behavior[property_type][0]
             
             if not entity_mapping:
                 _LOGGER.warning(
@@ -312,10 +359,12 @@ class StatePropertyUpdater:
             should_persist = self._should_persist(property_type, persist)
             
             if should_persist:
-                # Store in device attributes for persistence
-                self._store_state_value(device, property_type, value, index)
-                # Use executor to avoid blocking I/O
-                await self.hass.async_add_executor_job(self.device_storage.save_device, device)
+                # Journal the value instead of rewriting the storage file
+                # (use executor to avoid blocking I/O)
+                key, entry = self._state_value_entry(property_type, value, index)
+                await self.hass.async_add_executor_job(
+                    self.device_storage.append_state_values, device_id, {key: entry}
+                )
                 _LOGGER.debug(f"Persisted STATE property {property_type.value} for device {device_id}")
             
             _LOGGER.info(
@@ -348,7 +397,11 @@ class StatePropertyUpdater:
             if not device:
                 raise PropertyUpdateError(f"Device {device_id} not found")
             
-            any_persisted = False
+            state_values: dict[str, dict[str, Any]] = {}
+            
+            # Pending pushes per (entity, property type); the last value wins,
+            # so each entity gets one service call instead of one per channel
+            pushes: dict[tuple[str, StatePropertyType], Any] = {}
             
             # Process all updates
             for (property_type, index), value in updates.items():
@@ -356,22 +409,27 @@ class StatePropertyUpdater:
                 entity_mapping = self._get_entity_mapping(device, property_type, index)
                 
                 # Check if this is a read-only input property
-                is_read_only_input = property_type in self.read_only_input_properties
+                is_read_only_input = not self._behavior[property_type][0]
                 
                 if entity_mapping and not is_read_only_input:
                     # Push to HA entity (skip for read-only inputs)
-                    await self._push_to_ha_entity(entity_mapping, value, property_type)
+                    pushes[(entity_mapping, property_type)] = value
                 
                 # Check persistence
                 should_persist = self._should_persist(property_type, persist)
                 
                 if should_persist:
-                    self._store_state_value(device, property_type, value, index)
-                    any_persisted = True
+                    key, entry = self._state_value_entry(property_type, value, index)
+                    state_values[key] = entry
             
-            # Single persistence operation if any updates need it (use executor to avoid blocking I/O)
-            if any_persisted:
-                await self.hass.async_add_executor_job(self.device_storage.save_device, device)
+            for (entity_mapping, property_type), value in pushes.items():
+                await self._push_to_ha_entity(entity_mapping, value, property_type)
+            
+            # Single journal write if any updates need it (use executor to avoid blocking I/O)
+            if state_values:
+                await self.hass.async_add_executor_job(
+                    self.device_storage.append_state_values, device_id, state_values
+                )
             
             _LOGGER.info(
                 f"Updated {len(updates)} STATE properties for device {device_id}"
@@ -400,24 +458,12 @@ class StatePropertyUpdater:
         """
         entity_mappings = device.attributes.get("entity_mappings", {})
         
-        # Build the property key (e.g., "sensor[0].value", "channel[2].value")
-        if index is not None:
-            # Extract base property name (e.g., "sensor.value" -> "sensor", "value")
-            parts = property_type.value.split(".")
-            if len(parts) == 2:
-                base, prop = parts
-                property_key = f"{base}[{index}].{prop}"
-            else:
-                property_key = f"{property_type.value}[{index}]"
-        else:
-            property_key = property_type.value
-        
         # Check for direct mapping or attribute-based mapping
-        entity_id = entity_mappings.get(property_key)
+        entity_id = entity_mappings.get(_entity_mapping_key(property_type, index))
         
-        # If attribute mapping, it might be "entity@attribute"
-        if entity_id and "@" in entity_id:
-            return entity_id.split("@")[0]  # Return base entity
+        # If attribute mapping, it might be "entity@attribute"; return base entity
+        if entity_id:
+            return entity_id.partition("@")[0]
         
         return entity_id
     
@@ -611,46 +657,26 @@ class StatePropertyUpdater:
         if override is not None:
             return override
         
-        # Critical properties MUST be persisted
-        if property_type in self.critical_persistent_properties:
-            return True
-        
-        # Recommended properties SHOULD be persisted
-        if property_type in self.recommended_persistent_properties:
-            return True
-        
-        # Transient properties (button clicks, etc.) are NOT persisted by default
-        if property_type in [
-            StatePropertyType.BUTTON_VALUE,
-            StatePropertyType.BUTTON_ACTION_ID,
-            StatePropertyType.BUTTON_ACTION_MODE,
-        ]:
-            return False
-        
-        # Default: persist for safety
-        return True
+        # Critical and recommended properties are always persisted, transient
+        # ones (button clicks, etc.) are not; everything else is persisted for safety
+        return self._behavior[property_type][1]
     
-    def _store_state_value(
+    def _state_value_entry(
         self,
-        device: VirtualDevice,
         property_type: StatePropertyType,
         value: Any,
         index: Optional[int],
-    ) -> None:
-        """Store a STATE value in device attributes for persistence.
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the state_values key and entry for persisting a STATE value.
         
         Args:
-            device: VirtualDevice instance
             property_type: Type of STATE property
             value: Value to store
             index: Optional index for multi-instance properties
+            
+        Returns:
+            Tuple of (storage key, {"value", "timestamp"} entry)
         """
-        # Create state_values dict if it doesn't exist
-        if "state_values" not in device.attributes:
-            device.attributes["state_values"] = {}
-        
-        state_values = device.attributes["state_values"]
-        
         # Build the storage key
         if index is not None:
             key = f"{property_type.value}[{index}]"
@@ -658,7 +684,7 @@ class StatePropertyUpdater:
             key = property_type.value
         
         # Store the value with timestamp
-        state_values[key] = {
+        return key, {
             "value": value,
             "timestamp": datetime.now().isoformat(),
         }
@@ -683,13 +709,37 @@ class PropertyUpdater:
             device_storage: DeviceStorage instance
         """
         self.hass = hass
+        self.device_storage = device_storage
         self.config_updater = ConfigPropertyUpdater(hass, device_storage)
         self.state_updater = StatePropertyUpdater(hass, device_storage)
     
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[PropertyUpdater]:
+        """Persist all property updates made inside the block with one write.
+        
+        Updates are applied to the in-memory devices (and pushed to HA
+        entities) immediately; the storage file is rewritten once when the
+        block exits.
+        
+        Example:
+            async with updater.batch():
+                for i in range(8):
+                    await updater.update_property(device_id, "channel.value", 0.0, index=i)
+        
+        Yields:
+            This updater instance
+        """
+        try:
+            with self.device_storage.batch(flush=False):
+                yield self
+        finally:
+            # Write deferred changes without blocking the event loop
+            await self.hass.async_add_executor_job(self.device_storage.flush)
+    
     async def update_property(
         self,
         device_id: str,
-        property_type: str,
+        property_type: str | StatePropertyType,
         value: Any,
         index: Optional[int] = None,
         persist_state: Optional[bool] = None,
@@ -698,7 +748,7 @@ class PropertyUpdater:
         
         Args:
             device_id: Device identifier
-            property_type: Property type (can be StatePropertyType enum or string path)
+            property_type: StatePropertyType, its string value, or a CONFIG property path
             value: New value
             index: Optional index for multi-instance properties
             persist_state: For STATE properties, override auto-persistence
@@ -706,15 +756,18 @@ class PropertyUpdater:
         Returns:
             True if update successful, False otherwise
         """
-        # Try to parse as StatePropertyType
-        try:
-            state_prop_type = StatePropertyType(property_type)
+        if isinstance(property_type, StatePropertyType):
+            state_prop_type = property_type
+        else:
+            state_prop_type = _STATE_PROPERTY_TYPES.get(property_type)
+        
+        if state_prop_type is not None:
             # It's a STATE property
             return await self.state_updater.update_state_property(
                 device_id, state_prop_type, value, index, persist_state
             )
-        except ValueError:
-            # It's a CONFIG property
-            return await self.config_updater.update_config_property(
-                device_id, property_type, value, index
-            )
+        
+        # It's a CONFIG property
+        return await self.config_updater.update_config_property(
+            device_id, property_type, value, index
+        )
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from typing import Any, Optional
 
 from homeassistant.core import HomeAssistant
@@ -20,6 +21,39 @@ from ..models.virtual_device import VirtualDevice
 
 _LOGGER = logging.getLogger(__name__)
 
+# State key pattern: "property.name[index]" or "property.name"
+_STATE_KEY_RE = re.compile(r"^(.+?)(?:\[(\d+)\])?$")
+
+# STATE property types by value, so unknown keys don't raise ValueError
+_STATE_PROPERTY_TYPES: dict[str, StatePropertyType] = {
+    property_type.value: property_type for property_type in StatePropertyType
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_state_key(key: str) -> tuple[Optional[StatePropertyType], Optional[int]]:
+    """Parse a state key into property type and optional index.
+    
+    Cached because the same keys (e.g. "channel.value[0]") repeat across
+    every device being restored.
+    """
+    match = _STATE_KEY_RE.match(key)
+    
+    if not match:
+        return None, None
+    
+    property_type_str, index_str = match.groups()
+    
+    # Try to parse as StatePropertyType
+    property_type = _STATE_PROPERTY_TYPES.get(property_type_str)
+    if property_type is None:
+        _LOGGER.debug("Unknown state property type: %s", property_type_str)
+        return None, None
+    
+    index = int(index_str) if index_str else None
+    
+    return property_type, index
+
 
 class StateRestorer:
     """Restores persisted STATE property values for virtual devices.
@@ -267,25 +301,7 @@ class StateRestorer:
         Returns:
             Tuple of (StatePropertyType, index) or (None, None) if invalid
         """
-        # Pattern: "property.name[index]" or "property.name"
-        pattern = r"^(.+?)(?:\[(\d+)\])?$"
-        match = re.match(pattern, key)
-        
-        if not match:
-            return None, None
-        
-        property_type_str, index_str = match.groups()
-        
-        # Try to parse as StatePropertyType
-        try:
-            property_type = StatePropertyType(property_type_str)
-        except ValueError:
-            _LOGGER.debug("Unknown state property type: %s", property_type_str)
-            return None, None
-        
-        index = int(index_str) if index_str else None
-        
-        return property_type, index
+        return _parse_state_key(key)
 
 
 async def restore_states_on_startup(
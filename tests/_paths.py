@@ -0,0 +1,14 @@
+"""Import paths for the tests.
+
+The model modules are imported standalone (as in docs/examples), so the
+tests run without Home Assistant installed.
+"""
+
+import sys
+from pathlib import Path
+
+_INTEGRATION = Path(__file__).resolve().parent.parent / "custom_components" / "virtual_digitalstrom_devices"
+
+for _path in (_INTEGRATION / "models", _INTEGRATION / "storage"):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
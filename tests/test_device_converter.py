@@ -0,0 +1,122 @@
+"""Tests for the VirtualDevice -> PropertyElement converter."""
+
+import copy
+import unittest
+
+from . import _paths  # noqa: F401  (adds the model modules to sys.path)
+
+from device_converter import (
+    merge_property_updates,
+    merge_property_updates_batch,
+    virtual_device_to_property_element,
+)
+from property_element import (
+    PropertyElement,
+    build_property_tree_from_dict,
+    property_tree_to_dict,
+)
+from virtual_device import VirtualDevice
+
+
+def _value(tree, name):
+    return tree.get_element(name).value.to_python()
+
+
+class DeviceTreeTest(unittest.TestCase):
+    """Each call builds a fresh tree from the current device state."""
+    
+    def test_calls_return_independent_trees(self):
+        device = VirtualDevice(name="Lamp")
+        first = virtual_device_to_property_element(device)
+        first.get_element("name").value.v_string = "Edited"
+        self.assertEqual(_value(virtual_device_to_property_element(device), "name"), "Lamp")
+    
+    def test_field_assignment_is_reflected(self):
+        device = VirtualDevice(name="Lamp", zone_id=1)
+        self.assertEqual(_value(virtual_device_to_property_element(device), "name"), "Lamp")
+        
+        device.name = "Renamed"
+        device.zone_id = 2
+        tree = virtual_device_to_property_element(device)
+        self.assertEqual(_value(tree, "name"), "Renamed")
+        self.assertEqual(_value(tree, "zoneID"), 2)
+    
+    def test_in_place_edit_is_reflected(self):
+        device = VirtualDevice(attributes={"modelFeatures": {"blink": True}})
+        virtual_device_to_property_element(device)
+        device.attributes["modelFeatures"]["blink"] = False
+        tree = virtual_device_to_property_element(device)
+        self.assertFalse(_value(tree.get_element("modelFeatures"), "blink"))
+    
+    def test_lazy_branches_capture_build_time_data(self):
+        device = VirtualDevice(attributes={"modelFeatures": {"blink": True}})
+        tree = virtual_device_to_property_element(device)
+        device.attributes["modelFeatures"]["blink"] = False
+        device.configurations[:] = ["other"]
+        
+        self.assertTrue(_value(tree.get_element("modelFeatures"), "blink"))
+        self.assertIsNotNone(tree.get_element("configurations").get_element("default"))
+
+
+
+def _tree(data):
+    return build_property_tree_from_dict(data, "root")
+
+
+class MergePropertyUpdatesTest(unittest.TestCase):
+    """Merged trees match sequential merges and leave the target alone."""
+    
+    def setUp(self):
+        self.target = _tree({"a": {"x": 1, "y": 2}, "b": 3, "c": {"z": 4}})
+    
+    def test_value_replaces_branch(self):
+        update = PropertyElement(name="root", elements=[PropertyElement.create_leaf("a", 5)])
+        merged = merge_property_updates(self.target, update)
+        self.assertEqual(property_tree_to_dict(merged)["a"], 5)
+    
+    def test_branch_replaces_leaf(self):
+        merged = merge_property_updates(self.target, _tree({"b": {"w": 6}}))
+        self.assertEqual(property_tree_to_dict(merged)["b"], {"w": 6})
+    
+    def test_branches_merge_by_name(self):
+        merged = merge_property_updates(self.target, _tree({"a": {"y": 7, "v": 8}}))
+        self.assertEqual(property_tree_to_dict(merged)["a"], {"x": 1, "y": 7, "v": 8})
+    
+    def test_updates_apply_in_order(self):
+        updates = [
+            _tree({"a": {"v": 8}, "d": 1}),
+            PropertyElement(name="root", elements=[PropertyElement.create_leaf("a", 5)]),
+            _tree({"a": {"w": 9}, "e": 2}),
+            _tree({"d": 3}),
+        ]
+        merged = merge_property_updates_batch(self.target, updates)
+        self.assertEqual(
+            property_tree_to_dict(merged),
+            {"a": {"w": 9}, "b": 3, "c": {"z": 4}, "d": 3, "e": 2},
+        )
+        self.assertEqual([child.name for child in merged.elements], ["a", "b", "c", "d", "e"])
+    
+    def test_batch_equals_sequential_merges(self):
+        updates = [
+            _tree({"a": {"x": 10}}),
+            _tree({"b": {"w": 6}, "f": 1}),
+            PropertyElement(name="root", elements=[PropertyElement.create_leaf("b", 0)]),
+            _tree({"a": {"v": 8}, "c": {"z": 11}}),
+        ]
+        sequential = self.target
+        for update in updates:
+            sequential = merge_property_updates(sequential, update)
+        self.assertEqual(merge_property_updates_batch(self.target, updates), sequential)
+    
+    def test_target_is_not_modified(self):
+        original = copy.deepcopy(self.target)
+        merged = merge_property_updates_batch(
+            self.target, [_tree({"a": {"x": 10}}), _tree({"b": {"w": 6}, "d": 1})]
+        )
+        self.assertEqual(self.target, original)
+        # Subtrees without updates are shared
+        self.assertIs(merged.get_element("c"), self.target.get_element("c"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests for the YAML device storage."""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from . import _paths  # noqa: F401  (adds the model modules to sys.path)
+
+from device_storage import DeviceStorage
+from virtual_device import VirtualDevice
+
+
+class DeviceStorageTestCase(unittest.TestCase):
+    """Storage in a temporary directory."""
+    
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_path = Path(tmp_dir.name)
+        self.storage_path = self.tmp_path / "devices.yaml"
+
+
+class FailedSaveTest(DeviceStorageTestCase):
+    """A failed write keeps the changes pending."""
+    
+    def test_flush_retries_after_failed_write(self):
+        # A file where the storage directory should be makes the write fail
+        blocker = self.tmp_path / "blocked"
+        blocker.write_text("")
+        storage = DeviceStorage(blocker / "devices.yaml")
+        
+        with self.assertLogs("device_storage", level="ERROR"):
+            with storage.batch():
+                storage.add_device(VirtualDevice(device_id="lamp", name="Lamp"))
+        
+        blocker.unlink()
+        storage.flush()
+        
+        reloaded = DeviceStorage(blocker / "devices.yaml")
+        reloaded.load()
+        self.assertIsNotNone(reloaded.get_device("lamp"))
+
+
+
+class StateJournalTest(DeviceStorageTestCase):
+    """STATE values are journaled and folded into the storage file."""
+    
+    def setUp(self):
+        super().setUp()
+        self.storage = DeviceStorage(self.storage_path)
+        self.storage.add_device(VirtualDevice(device_id="lamp", name="Lamp"))
+        self.storage.append_state_values("lamp", {"brightness": {"value": 50, "timestamp": 1.0}})
+    
+    def _reload(self):
+        storage = DeviceStorage(self.storage_path)
+        storage.load()
+        return storage
+    
+    def _state_values(self, storage):
+        return storage.get_device("lamp").attributes.get("state_values", {})
+    
+    def test_journal_is_replayed_over_storage_file(self):
+        self.assertNotIn("brightness", self.storage_path.read_text())
+        self.assertTrue(self.storage.journal_path.exists())
+        
+        self.storage.append_state_values("lamp", {"brightness": {"value": 75, "timestamp": 2.0}})
+        self.assertEqual(self._state_values(self._reload())["brightness"]["value"], 75)
+    
+    def test_torn_last_line_is_skipped_and_compacted(self):
+        with open(self.storage.journal_path, "ab") as journal:
+            journal.write(b'{"d": "lamp", "k": "pow')
+        
+        with self.assertLogs("device_storage", level="WARNING"):
+            storage = self._reload()
+        self.assertEqual(self._state_values(storage), {"brightness": {"value": 50, "timestamp": 1.0}})
+        
+        # The next append compacts instead of writing after the torn line
+        storage.append_state_values("lamp", {"power": {"value": True, "timestamp": 2.0}})
+        self.assertFalse(storage.journal_path.exists())
+        self.assertEqual(
+            self._state_values(self._reload()),
+            {
+                "brightness": {"value": 50, "timestamp": 1.0},
+                "power": {"value": True, "timestamp": 2.0},
+            },
+        )
+    
+    def test_save_removes_journal(self):
+        self.storage.update_device("lamp", name="Renamed")
+        self.assertFalse(self.storage.journal_path.exists())
+        
+        storage = self._reload()
+        self.assertEqual(storage.get_device("lamp").name, "Renamed")
+        self.assertEqual(self._state_values(storage)["brightness"]["value"], 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
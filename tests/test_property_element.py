@@ -0,0 +1,123 @@
+"""Tests for the PropertyElement model."""
+
+import dataclasses
+import unittest
+
+from . import _paths  # noqa: F401  (adds the model modules to sys.path)
+
+from property_element import (
+    PropertyElement,
+    build_property_tree_from_dict,
+    property_tree_to_dict,
+)
+from property_tree import (
+    ConfigurationInputDescriptions,
+    ConfigurationOutputChannels,
+    ConfigurationPropertyTree,
+    DeviceConfigurations,
+)
+
+
+class GetElementTest(unittest.TestCase):
+    """get_element must reflect direct edits to `elements`."""
+    
+    def setUp(self):
+        self.tree = build_property_tree_from_dict({"a": 1, "b": 2}, "root")
+        # Build the name index
+        self.assertEqual(self.tree.get_element("a").value.to_python(), 1)
+    
+    def test_replace_child(self):
+        self.tree.elements[0] = PropertyElement.create_leaf("a", 99)
+        self.assertEqual(self.tree.get_element("a").value.to_python(), 99)
+    
+    def test_pop_and_append(self):
+        self.tree.elements.pop(1)
+        self.tree.elements.append(PropertyElement.create_leaf("c", 3))
+        self.assertIsNone(self.tree.get_element("b"))
+        self.assertEqual(self.tree.get_element("c").value.to_python(), 3)
+    
+    def test_rename_in_place(self):
+        self.tree.elements[0] = PropertyElement.create_leaf("x", 5)
+        self.assertIsNone(self.tree.get_element("a"))
+        self.assertEqual(self.tree.get_element("x").value.to_python(), 5)
+    
+    def test_add_element(self):
+        self.tree.add_element(PropertyElement.create_leaf("d", 4))
+        self.assertEqual(self.tree.get_element("d").value.to_python(), 4)
+    
+    def test_first_child_wins(self):
+        self.tree.add_element(PropertyElement.create_leaf("a", 7))
+        self.assertEqual(self.tree.get_element("a").value.to_python(), 1)
+    
+    def test_first_child_wins_after_replace(self):
+        self.tree.elements[0] = PropertyElement.create_leaf("b", 9)
+        self.assertIs(self.tree.get_element("b"), self.tree.elements[0])
+    
+    def test_child_renamed_in_place(self):
+        self.tree.elements[0].name = "x"
+        self.assertIsNone(self.tree.get_element("a"))
+        self.assertIs(self.tree.get_element("x"), self.tree.elements[0])
+    
+    def test_elements_list_replaced(self):
+        self.tree.elements = [PropertyElement.create_leaf("b", 5)]
+        self.assertEqual(self.tree.get_element("b").value.to_python(), 5)
+        self.assertIsNone(self.tree.get_element("a"))
+    
+    def test_index_is_not_a_dataclass_field(self):
+        self.assertEqual(
+            [f.name for f in dataclasses.fields(PropertyElement)],
+            ["name", "value", "elements"],
+        )
+        self.assertNotIn("_name_index", dataclasses.asdict(self.tree))
+        self.assertNotIn("_name_index", repr(self.tree))
+
+
+class SharedLeafElementsTest(unittest.TestCase):
+    """Leaves share one immutable empty children list."""
+    
+    def test_leaf_elements_compare_equal_to_empty_list(self):
+        leaf = PropertyElement.create_leaf("a", 1)
+        self.assertEqual(leaf.elements, [])
+        self.assertEqual(leaf, PropertyElement.from_dict(leaf.to_dict()))
+    
+    def test_direct_append_raises(self):
+        leaf = PropertyElement.create_leaf("a", 1)
+        with self.assertRaises(TypeError):
+            leaf.elements.append(PropertyElement.create_leaf("b", 2))
+        self.assertEqual(PropertyElement.create_leaf("c", 3).elements, [])
+    
+    def test_add_element_replaces_shared_list(self):
+        element = PropertyElement.create_leaf("a", 1)
+        element.value = None
+        element.add_element(PropertyElement.create_leaf("b", 2))
+        self.assertEqual(element.get_element("b").value.to_python(), 2)
+        self.assertEqual(PropertyElement.create_leaf("c", 3).elements, [])
+
+
+
+class PropertyTreeToDictTest(unittest.TestCase):
+    """Branches always come back as dicts keyed by child name."""
+    
+    def test_list_branch_becomes_index_keyed_dict(self):
+        tree = build_property_tree_from_dict({"ids": [5, 6], "nested": {"x": {"y": 1}}}, "root")
+        self.assertEqual(
+            property_tree_to_dict(tree),
+            {"ids": {"0": 5, "1": 6}, "nested": {"x": {"y": 1}}},
+        )
+    
+    def test_configuration_round_trip(self):
+        config = ConfigurationPropertyTree(
+            "default",
+            inputs=ConfigurationInputDescriptions([1, 2]),
+            outputs=ConfigurationOutputChannels(0, [5, 6]),
+        )
+        tree = build_property_tree_from_dict({"default": config.to_property_element()}, "configurations")
+        configurations = DeviceConfigurations.from_property_elements(property_tree_to_dict(tree))
+        
+        restored = configurations.get_configuration("default")
+        self.assertEqual(restored.inputs.button_input_ids, [1, 2])
+        self.assertEqual(restored.outputs.channel_ids, [5, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
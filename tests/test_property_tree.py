@@ -0,0 +1,52 @@
+"""Tests for the vDC property tree structures."""
+
+import dataclasses
+import unittest
+
+from . import _paths  # noqa: F401  (adds the model modules to sys.path)
+
+from property_tree import ConfigurationPropertyTree, DeviceConfigurations
+
+
+class DeviceConfigurationsTest(unittest.TestCase):
+    """Configurations stay a plain list; lookups go through the ID index."""
+    
+    def setUp(self):
+        self.configs = DeviceConfigurations(
+            configurations=[ConfigurationPropertyTree("a"), ConfigurationPropertyTree("b")]
+        )
+        # Build the ID index
+        self.assertEqual(self.configs.get_configuration("a").config_id, "a")
+    
+    def test_direct_append(self):
+        self.configs.configurations.append(ConfigurationPropertyTree("c"))
+        self.assertEqual(self.configs.to_config_id_list(), ["a", "b", "c"])
+        self.assertIsNotNone(self.configs.get_configuration("c"))
+    
+    def test_direct_replace(self):
+        replacement = ConfigurationPropertyTree("b")
+        self.configs.configurations[0] = replacement
+        self.assertIs(self.configs.get_configuration("b"), replacement)
+        self.assertIsNone(self.configs.get_configuration("a"))
+    
+    def test_add_configuration_replaces_same_id(self):
+        replacement = ConfigurationPropertyTree("a", description="new")
+        self.configs.add_configuration(replacement)
+        self.configs.add_configuration(ConfigurationPropertyTree("c"))
+        self.assertEqual(self.configs.to_config_id_list(), ["a", "b", "c"])
+        self.assertIs(self.configs.get_configuration("a"), replacement)
+    
+    def test_index_is_not_a_dataclass_field(self):
+        self.assertEqual(
+            [f.name for f in dataclasses.fields(DeviceConfigurations)],
+            ["configurations", "current_config_id"],
+        )
+        self.assertEqual(
+            set(dataclasses.asdict(self.configs)),
+            {"configurations", "current_config_id"},
+        )
+        self.assertEqual(self.configs, DeviceConfigurations(list(self.configs.configurations)))
+
+
+if __name__ == "__main__":
+    unittest.main()